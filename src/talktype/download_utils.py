@@ -33,6 +33,7 @@ def download_file(
     progress_hook=None,
     expected_sha256: str | None = None,
     user_agent: str = "TalkType",
+    opener=None,
 ) -> bool:
     """Download *url* to *dest_path* safely. Returns True on success.
 
@@ -43,6 +44,8 @@ def download_file(
     - *progress_hook(downloaded_bytes, total_bytes)* is called per chunk
       (total_bytes is 0 when the server sends no Content-Length).
     - *expected_sha256* is verified before the file lands at dest_path.
+    - *opener* (urllib OpenerDirector) lets callers reuse one handler chain
+      across requests; defaults to urllib's global urlopen.
     - Truncated transfers are rejected: HTTP read() returns b"" on a
       premature EOF without raising, so the byte count is compared against
       Content-Length explicitly.
@@ -54,7 +57,8 @@ def download_file(
     sha = hashlib.sha256()
     try:
         request = urllib.request.Request(url, headers={"User-Agent": user_agent})
-        with urllib.request.urlopen(request, timeout=timeout) as response:
+        open_url = opener.open if opener is not None else urllib.request.urlopen
+        with open_url(request, timeout=timeout) as response:
             total = int(response.headers.get("Content-Length", 0) or 0)
             downloaded = 0
             parent = os.path.dirname(tmp_path)
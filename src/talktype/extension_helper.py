@@ -5,9 +5,7 @@ GNOME Extension installer for TalkType
 
 import os
 import shutil
-import subprocess
 import urllib.request
-from pathlib import Path
 from typing import Optional, Callable
 
 from . import desktop_detect
@@ -21,6 +19,20 @@ EXTENSION_DOWNLOAD_URL = f'https://github.com/ronb1964/TalkType/releases/latest/
 # closes a code-execution vector (a corrupted or tampered zip).
 EXTENSION_CHECKSUMS_URL = 'https://github.com/ronb1964/TalkType/releases/latest/download/SHA256SUMS.txt'
 
+# One handler chain shared by the checksum fetch and the zip download (and
+# any retry in the same process) instead of rebuilding urllib state per call.
+# The zip is already deflated, so ask for identity encoding explicitly.
+_OPENER = urllib.request.build_opener()
+_REQUEST_HEADERS = {'User-Agent': 'TalkType', 'Accept-Encoding': 'identity'}
+
+# Bundled-extension candidate paths already found to be missing
+_MISSING_BUNDLE_PATHS: set = set()
+
+# Source checkout layout (never changes at runtime)
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(_THIS_DIR))
+_DEV_EXTENSION_PATH = os.path.join(_PROJECT_ROOT, 'gnome-extension', EXTENSION_UUID)
+
 
 def _fetch_extension_sha256() -> Optional[str]:
     """Fetch the expected sha256 of the extension zip from the release.
@@ -30,9 +42,8 @@ def _fetch_extension_sha256() -> Optional[str]:
     """
     from .download_utils import parse_sha256sums
     try:
-        request = urllib.request.Request(
-            EXTENSION_CHECKSUMS_URL, headers={"User-Agent": "TalkType"})
-        with urllib.request.urlopen(request, timeout=10) as response:
+        request = urllib.request.Request(EXTENSION_CHECKSUMS_URL, headers=_REQUEST_HEADERS)
+        with _OPENER.open(request, timeout=10) as response:
             sums = parse_sha256sums(response.read().decode("utf-8"))
         return sums.get(EXTENSION_ZIP_NAME)
     except Exception:
@@ -75,13 +86,44 @@ def get_extension_status() -> dict:
     }
 
 
-def install_extension_from_local(source_dir: str, auto_enable: bool = True) -> bool:
+def _place_extension_files(source_dir: str, target_dir: str, move: bool = False) -> None:
+    """
+    Populate target_dir from source_dir using the cheapest method available.
+
+    A rename moves the whole tree without touching file contents, but only
+    when the caller owns source_dir (e.g. a temp extraction dir). Otherwise
+    hardlink each file, which avoids the read+write of a byte copy when the
+    source lives on the same filesystem. Cross-device sources and the
+    read-only AppImage squashfs mount fall back to a plain copy.
+    """
+    if move:
+        try:
+            os.rename(source_dir, target_dir)
+            return
+        except OSError:
+            pass
+
+    # Files on the AppImage squashfs mount can never be hardlinked into $HOME
+    if not source_dir.startswith('/tmp/.mount_'):
+        try:
+            shutil.copytree(source_dir, target_dir, copy_function=os.link)
+            return
+        except OSError:
+            # Cross-device or unsupported - clear the partial tree and copy
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+    shutil.copytree(source_dir, target_dir)
+
+
+def install_extension_from_local(source_dir: str, auto_enable: bool = True,
+                                 move: bool = False) -> bool:
     """
     Install extension from local directory
 
     Args:
         source_dir: Path to extension source directory
         auto_enable: If True, automatically enable the extension after installation
+        move: If True, source_dir may be moved into place (it is consumed)
 
     Returns:
         bool: True if successful
@@ -97,8 +139,8 @@ def install_extension_from_local(source_dir: str, auto_enable: bool = True) -> b
         if os.path.exists(target_dir):
             shutil.rmtree(target_dir)
 
-        # Copy extension files
-        shutil.copytree(source_dir, target_dir)
+        # Place extension files (rename, hardlink or copy)
+        _place_extension_files(source_dir, target_dir, move=move)
 
         print(f"✅ Extension installed to {target_dir}")
 
@@ -132,10 +174,11 @@ def get_bundled_extension_path() -> Optional[str]:
     appimage_path = os.environ.get('APPIMAGE')
     if appimage_path:
         # AppImage mount point - extension should be in usr/share/gnome-extension/
+        # (the only candidate with a '..' segment, so the only one normalized)
         appimage_mount = os.path.dirname(sys.executable)
-        possible_paths.append(
+        possible_paths.append(os.path.normpath(
             os.path.join(appimage_mount, '..', 'share', 'gnome-extension', EXTENSION_UUID)
-        )
+        ))
 
     # Check squashfs mount point (AppImage internal path)
     if '/tmp/.mount_' in sys.executable or 'squashfs-root' in sys.executable:
@@ -145,19 +188,23 @@ def get_bundled_extension_path() -> Optional[str]:
         )
 
     # Development environment - relative to this file
-    this_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(this_dir))
-    possible_paths.append(
-        os.path.join(project_root, 'gnome-extension', EXTENSION_UUID)
-    )
+    possible_paths.append(_DEV_EXTENSION_PATH)
 
-    # Check each path
+    # Check each path. Bundled files never appear while we're running, so
+    # misses are remembered and skipped on later calls.
     for path in possible_paths:
-        normalized = os.path.normpath(path)
-        metadata_file = os.path.join(normalized, 'metadata.json')
+        if path in _MISSING_BUNDLE_PATHS:
+            continue
+        # Most candidates don't exist at all - one stat on the share dir
+        # rules them out before looking for metadata.json
+        if not os.path.isdir(os.path.dirname(path)):
+            _MISSING_BUNDLE_PATHS.add(path)
+            continue
+        metadata_file = os.path.join(path, 'metadata.json')
         if os.path.isfile(metadata_file):
-            print(f"✅ Found bundled extension at: {normalized}")
-            return normalized
+            print(f"✅ Found bundled extension at: {path}")
+            return path
+        _MISSING_BUNDLE_PATHS.add(path)
 
     return None
 
@@ -186,16 +233,10 @@ def install_extension(progress_callback: Optional[Callable] = None) -> bool:
         if progress_callback:
             progress_callback("Installing bundled extension...", 50)
 
+        # install_extension_from_local enables the extension by default
         if install_extension_from_local(bundled_path):
             if progress_callback:
                 progress_callback("Extension installed successfully!", 100)
-
-            # Enable the extension
-            if enable_extension():
-                print("✅ Extension enabled - will be active after logout/login")
-            else:
-                print("⚠️  Failed to auto-enable extension - you can enable it manually from Extensions app")
-
             return True
         else:
             print("⚠️  Failed to install bundled extension, trying download...")
@@ -232,11 +273,18 @@ def download_and_install_extension(progress_callback: Optional[Callable] = None)
             if progress_callback:
                 progress_callback("Downloading extension...", 10)
 
-            # Download hook
+            # Download hook - called per chunk, so only report when the
+            # displayed percentage actually changes
+            last_shown = [-1]
+
             def download_progress_hook(downloaded, total_size):
                 if progress_callback and total_size > 0:
+                    shown = int((downloaded / total_size) * 100)
+                    if shown == last_shown[0]:
+                        return
+                    last_shown[0] = shown
                     percent = min(90, 10 + int((downloaded / total_size) * 70))
-                    progress_callback(f"Downloading... {int((downloaded / total_size) * 100)}%", percent)
+                    progress_callback(f"Downloading... {shown}%", percent)
 
             # Download extension zip. The timeout matters: the old
             # urlretrieve call had none, so a stalled connection hung the
@@ -250,6 +298,7 @@ def download_and_install_extension(progress_callback: Optional[Callable] = None)
                 timeout=60,
                 progress_hook=download_progress_hook,
                 expected_sha256=expected_sha256,
+                opener=_OPENER,
             ):
                 if progress_callback:
                     progress_callback("Extension download failed or was corrupted", 0)
@@ -258,28 +307,59 @@ def download_and_install_extension(progress_callback: Optional[Callable] = None)
             if progress_callback:
                 progress_callback("Extracting extension...", 85)
 
-            # Extract zip
-            extract_dir = os.path.join(temp_dir, 'extracted')
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-
-            # Find extension directory in extracted files
-            extension_source = os.path.join(extract_dir, EXTENSION_UUID)
-            if not os.path.exists(extension_source):
-                # Maybe it's directly in extract_dir
-                extension_source = extract_dir
+                # Inspect the archive layout once instead of extracting and
+                # then probing the filesystem for the extension root
+                names = zip_ref.namelist()
+                top_level = {name.split('/', 1)[0] for name in names}
 
-            if progress_callback:
-                progress_callback("Installing extension...", 90)
-
-            # Install
-            if not install_extension_from_local(extension_source):
-                return False
+                if progress_callback:
+                    progress_callback("Installing extension...", 90)
+
+                if top_level == {EXTENSION_UUID}:
+                    # Archive already holds EXTENSION_UUID/... - extract it
+                    # next to the extensions directory (same filesystem, and
+                    # out of GNOME Shell's scan) and rename it into place, so
+                    # a corrupt archive or full disk leaves the installed
+                    # copy untouched
+                    ext_dir = desktop_detect.get_extension_dir()
+                    target_dir = os.path.join(ext_dir, EXTENSION_UUID)
+                    os.makedirs(ext_dir, exist_ok=True)
+                    staging_dir = tempfile.mkdtemp(prefix=".talktype-extension-",
+                                                   dir=os.path.dirname(ext_dir))
+                    try:
+                        zip_ref.extractall(staging_dir)
+                        previous_dir = None
+                        if os.path.exists(target_dir):
+                            previous_dir = os.path.join(staging_dir, "previous")
+                            os.rename(target_dir, previous_dir)
+                        try:
+                            os.rename(os.path.join(staging_dir, EXTENSION_UUID), target_dir)
+                        except OSError:
+                            if previous_dir:
+                                os.rename(previous_dir, target_dir)
+                            raise
+                    finally:
+                        # Also removes the replaced installation
+                        shutil.rmtree(staging_dir, ignore_errors=True)
+                    print(f"✅ Extension installed to {target_dir}")
+                else:
+                    # Mixed layout or files at the archive root - extract to
+                    # temp and move the extension directory into place
+                    extract_dir = os.path.join(temp_dir, 'extracted')
+                    zip_ref.extractall(extract_dir)
+                    extension_source = extract_dir
+                    if EXTENSION_UUID in top_level:
+                        extension_source = os.path.join(extract_dir, EXTENSION_UUID)
+                    if not install_extension_from_local(extension_source, auto_enable=False,
+                                                        move=True):
+                        return False
 
             if progress_callback:
                 progress_callback("Extension installed successfully!", 100)
 
-            # Enable the extension after installation
+            # Enable the extension after installation (the single enable for
+            # both extraction paths above)
             # This adds it to org.gnome.shell enabled-extensions so it persists across logout/login
             if progress_callback:
                 progress_callback("Enabling extension...", 95)
@@ -315,6 +395,8 @@ def uninstall_extension() -> bool:
     Returns:
         bool: True if successful
     """
+    import subprocess
+
     try:
         ext_dir = desktop_detect.get_extension_dir()
         target_dir = os.path.join(ext_dir, EXTENSION_UUID)
@@ -409,6 +491,8 @@ def offer_extension_installation(show_gui: bool = True) -> bool:
     Returns:
         bool: True if user accepted and installation succeeded
     """
+    # Both checks are an env lookup and a stat - settle them before paying
+    # for the Gtk import or building any dialog
     if not is_extension_available():
         return False
 
@@ -457,24 +541,28 @@ def offer_extension_installation(show_gui: bool = True) -> bool:
             success = [False]
 
             def do_install():
+                last_msg = [None]
+
                 def progress(msg, percent):
+                    # Don't queue a main-loop event for an unchanged label
+                    if msg == last_msg[0]:
+                        return
+                    last_msg[0] = msg
                     GLib.idle_add(lambda: progress_label.set_text(msg))
 
-                success[0] = install_extension(progress)
-                GLib.idle_add(progress_dialog.destroy)
+                try:
+                    success[0] = install_extension(progress)
+                finally:
+                    GLib.idle_add(progress_dialog.destroy)
+                    GLib.idle_add(Gtk.main_quit)
 
             import threading
-            thread = threading.Thread(target=do_install)
+            thread = threading.Thread(target=do_install, daemon=True)
             thread.start()
 
-            # Wait for completion, keeping the UI responsive. The short sleep
-            # stops this loop from spinning a CPU core at 100% — non-blocking
-            # main_iteration_do returns immediately when there are no events.
-            import time as _time
-            while thread.is_alive():
-                while Gtk.events_pending():
-                    Gtk.main_iteration_do(False)
-                _time.sleep(0.02)
+            # Block in a (possibly nested) main loop until the worker posts
+            # main_quit - the UI stays responsive without polling
+            Gtk.main()
 
             if success[0]:
                 # Show success message
@@ -512,13 +600,14 @@ def offer_extension_installation(show_gui: bool = True) -> bool:
                 return False
 
         except ImportError:
-            # Fall back to CLI
-            return offer_extension_installation(show_gui=False)
-    else:
-        # CLI mode
-        if offer_extension_installation_cli():
-            return install_extension()
-        return False
+            # Fall back to CLI (status was already checked above, so don't
+            # recurse and repeat it)
+            pass
+
+    # CLI mode
+    if offer_extension_installation_cli():
+        return install_extension()
+    return False
 
 
 if __name__ == '__main__':
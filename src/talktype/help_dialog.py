@@ -2,63 +2,15 @@
 TalkType Help Dialog - Shared help window for tray and preferences.
 """
 
+import os
+
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
-
-
-def show_help_dialog():
-    """Show help dialog with TalkType features and instructions."""
-    from gi.repository import Gdk
+from gi.repository import Gtk, Gdk, Pango
 
-    dialog = Gtk.Dialog(title="TalkType Help")
-    dialog.set_default_size(650, 550)
 
-    # Set minimum size but allow resizing larger
-    geo = Gdk.Geometry()
-    geo.min_width = 500
-    geo.min_height = 400
-    dialog.set_geometry_hints(None, geo, Gdk.WindowHints.MIN_SIZE)
-
-    dialog.set_resizable(True)  # Allow resizing
-    dialog.set_modal(False)  # Non-modal so it works without parent window
-    dialog.set_position(Gtk.WindowPosition.CENTER)
-    dialog.set_keep_above(True)  # Ensure it appears on top
-
-    content = dialog.get_content_area()
-    content.set_margin_top(10)
-    content.set_margin_bottom(10)
-    content.set_margin_start(10)
-    content.set_margin_end(10)
-
-    # Create notebook (tabbed interface)
-    notebook = Gtk.Notebook()
-    notebook.set_tab_pos(Gtk.PositionType.TOP)
-    content.pack_start(notebook, True, True, 0)
-
-    # Helper function to create a tab with scrolled content
-    def create_tab(title, markup_text):
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_margin_top(15)
-        scrolled.set_margin_bottom(15)
-        scrolled.set_margin_start(20)
-        scrolled.set_margin_end(20)
-
-        label = Gtk.Label()
-        label.set_markup(markup_text)
-        label.set_line_wrap(True)
-        label.set_xalign(0)
-        label.set_valign(Gtk.Align.START)
-
-        scrolled.add(label)
-        tab_label = Gtk.Label(label=title)
-        tab_label.set_halign(Gtk.Align.CENTER)  # Center text within the tab
-        tab_label.set_hexpand(True)             # Expand to fill tab width
-        notebook.append_page(scrolled, tab_label)
-
-    # Tab 1: Getting Started (merged best of tray + prefs)
-    create_tab("🚀 Getting Started", '''<span size="large"><b>Quick Start Guide</b></span>
+# Tab 1: Getting Started (merged best of tray + prefs)
+_GETTING_STARTED_MARKUP = '''<span size="large"><b>Quick Start Guide</b></span>
 
 <b>✨ TalkType is ready to use!</b>
 The dictation service starts automatically when you launch TalkType.
@@ -92,10 +44,10 @@ Text will be inserted where your cursor is located.
 The service automatically pauses after 5 minutes of inactivity to save
 system resources. Adjust this in Preferences → Advanced.
 
-<b>Need more help?</b> Check the other tabs for detailed information.''')
+<b>Need more help?</b> Check the other tabs for detailed information.'''
 
-    # Tab 2: Features
-    create_tab("✨ Features", '''<span size="large"><b>Key Features</b></span>
+# Tab 2: Features
+_FEATURES_MARKUP = '''<span size="large"><b>Key Features</b></span>
 
 <b>Both Hotkeys Always Active</b>
 • F8 (hold-to-talk) AND F9 (tap-to-toggle) work simultaneously
@@ -135,10 +87,10 @@ Quick one-click optimization via tray menu:
 • Launch at login option
 • System tray integration (GTK or GNOME extension)
 • Notification sounds (optional)
-• Desktop notifications (optional)''')
+• Desktop notifications (optional)'''
 
-    # Tab 3: AI Models
-    create_tab("🤖 AI Models", '''<span size="large"><b>Choosing the Right AI Model</b></span>
+# Tab 3: AI Models
+_AI_MODELS_MARKUP = '''<span size="large"><b>Choosing the Right AI Model</b></span>
 
 Configure in: Preferences → General → Model
 
@@ -180,10 +132,10 @@ Configure in: Preferences → General → Model
 
 <b>Recommendation:</b>
 Start with "small" for everyday use. Upgrade to "medium" or "large-v3"
-if you need better accuracy for professional or technical dictation.''')
+if you need better accuracy for professional or technical dictation.'''
 
-    # Tab 4: Advanced
-    create_tab("⚙️ Advanced", '''<span size="large"><b>Advanced Features</b></span>
+# Tab 4: Advanced
+_ADVANCED_MARKUP = '''<span size="large"><b>Advanced Features</b></span>
 
 <b>🎮 GPU Acceleration</b>
 If you have an NVIDIA graphics card, enable GPU acceleration for 3-5x faster transcription:
@@ -214,10 +166,10 @@ Fine-tune audio in Preferences → Audio tab:
 • Select specific microphone
 • Test audio levels
 • Adjust input volume (PulseAudio systems)
-• Enable/disable audio beeps''')
+• Enable/disable audio beeps'''
 
-    # Tab 5: Voice Commands
-    create_tab("🗣️ Voice Commands", '''<span size="large"><b>Voice Commands Reference</b></span>
+# Tab 5: Voice Commands
+_VOICE_COMMANDS_MARKUP = '''<span size="large"><b>Voice Commands Reference</b></span>
 
 Use these spoken commands during dictation to insert punctuation and formatting.
 
@@ -316,10 +268,10 @@ and punctuation — wrap the replacement text in double quotes:
 • Auto-capitalization after sentences
 • Trailing commas converted to periods before line breaks
 • Auto-period added if sentence has no punctuation
-• Smart quote placement and spacing''')
+• Smart quote placement and spacing'''
 
-    # Tab 6: Tips
-    create_tab("💡 Tips", '''<span size="large"><b>Tips &amp; Troubleshooting</b></span>
+# Tab 6: Tips
+_TIPS_MARKUP = '''<span size="large"><b>Tips &amp; Troubleshooting</b></span>
 
 <b>Keyboard Shortcuts:</b>
 • <b>F8:</b> Push-to-talk (hold to record, release to stop)
@@ -388,15 +340,152 @@ Found a bug or have a feature request? We'd love to hear from you!
 • <b>Include:</b> Your Linux distro, desktop environment, and TalkType version
 • <b>Log file:</b> ~/.config/talktype/talktype.log (helpful for debugging)
 
-Your feedback helps make TalkType better for everyone!''')
-
-    # Close button
-    close_button = Gtk.Button(label="Close")
-    close_button.connect("clicked", lambda w: dialog.destroy())
-    dialog.add_action_widget(close_button, Gtk.ResponseType.CLOSE)
+Your feedback helps make TalkType better for everyone!'''
+
+# Notebook tabs in display order, as parallel tables indexed by page number.
+# Titles and markup are static; the parsed text/attributes are filled in
+# once per tab, the first time that tab is displayed.
+_TAB_TITLES = (
+    "🚀 Getting Started",
+    "✨ Features",
+    "🤖 AI Models",
+    "⚙️ Advanced",
+    "🗣️ Voice Commands",
+    "💡 Tips",
+)
+_TAB_MARKUP = (
+    _GETTING_STARTED_MARKUP,
+    _FEATURES_MARKUP,
+    _AI_MODELS_MARKUP,
+    _ADVANCED_MARKUP,
+    _VOICE_COMMANDS_MARKUP,
+    _TIPS_MARKUP,
+)
+_tab_texts = [None] * len(_TAB_TITLES)
+_tab_attrs = [None] * len(_TAB_TITLES)
+
+
+# Window skeleton (window, notebook, Close button) for GtkBuilder
+_UI_FILE = os.path.join(os.path.dirname(__file__), 'help_dialog.ui')
+
+# Minimum window size (GTK copies the struct, so one instance is shared)
+_MIN_GEOMETRY = Gdk.Geometry()
+_MIN_GEOMETRY.min_width = 500
+_MIN_GEOMETRY.min_height = 400
+
+# Shared ScrolledWindow setup for every tab, applied in one set_properties call
+_SCROLLED_PROPS = {
+    'hscrollbar_policy': Gtk.PolicyType.NEVER,
+    'vscrollbar_policy': Gtk.PolicyType.AUTOMATIC,
+    'margin_top': 15,
+    'margin_bottom': 15,
+    'margin_start': 20,
+    'margin_end': 20,
+}
+
+
+def _parsed_tab(index):
+    """Return (plain text, Pango.AttrList) for a tab, parsing it once."""
+    if _tab_texts[index] is None:
+        _ok, attrs, text, _accel = Pango.parse_markup(_TAB_MARKUP[index], -1, '\0')
+        _tab_texts[index] = text
+        _tab_attrs[index] = attrs
+    return _tab_texts[index], _tab_attrs[index]
+
+
+# Built once per process and re-presented on later opens; closing only hides it
+_help_dialog = None
 
-    # Connect response to destroy (for non-blocking operation)
-    dialog.connect("response", lambda d, r: d.destroy())
 
+def show_help_dialog():
+    """Show help dialog with TalkType features and instructions."""
+    dialog = _get_help_dialog()
     dialog.show_all()
-    dialog.present()  # Bring to front and focus
+    # Raise and focus with the triggering event's timestamp (so focus-steal
+    # prevention allows it) instead of a sticky keep-above state
+    dialog.present_with_time(Gtk.get_current_event_time())
+
+
+def prewarm_help_dialog():
+    """Build the help dialog hidden once the main loop goes idle.
+
+    Call at app startup so the first Help click only has to present an
+    already-built window.
+    """
+    from gi.repository import GLib
+
+    def build():
+        _get_help_dialog()
+        return False  # run once
+
+    GLib.idle_add(build)
+
+
+def _get_help_dialog():
+    global _help_dialog
+    if _help_dialog is None:
+        _help_dialog = _build_help_dialog()
+    return _help_dialog
+
+
+def _forget_help_dialog(_widget):
+    global _help_dialog
+    _help_dialog = None
+
+
+def _build_help_dialog():
+    """Build the (hidden) help dialog with all of its tabs."""
+    # Window (a plain GtkWindow - no dialog action area or response
+    # plumbing needed), notebook and Close button come from the .ui skeleton
+    # in one GtkBuilder pass; only the tab pages are added from Python
+    builder = Gtk.Builder.new_from_file(_UI_FILE)
+    dialog = builder.get_object('help_dialog')
+    notebook = builder.get_object('notebook')
+
+    # Set minimum size but allow resizing larger
+    dialog.set_geometry_hints(None, _MIN_GEOMETRY, Gdk.WindowHints.MIN_SIZE)
+
+    # Empty tab scrollers, keyed by page index. Only the first tab is filled
+    # up front; the rest are filled the first time they are switched to, so
+    # unread tabs never parse their markup.
+    pending_tabs = {}
+
+    def fill_tab(scrolled, index):
+        text, attrs = _parsed_tab(index)
+        # All properties at construction: one g_object_new, no notify storm
+        label = Gtk.Label(label=text, attributes=attrs, wrap=True,
+                          xalign=0, valign=Gtk.Align.START)
+
+        scrolled.add(label)
+        label.show()
+
+    def on_switch_page(_notebook, _page, page_num):
+        scrolled = pending_tabs.pop(page_num, None)
+        if scrolled is not None:
+            fill_tab(scrolled, page_num)
+
+    # Helper function to create a tab with scrolled content
+    def create_tab(title):
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_properties(**_SCROLLED_PROPS)
+
+        # Centered text, expanded to fill the tab width
+        tab_label = Gtk.Label(label=title, halign=Gtk.Align.CENTER, hexpand=True)
+        page_num = notebook.append_page(scrolled, tab_label)
+
+        if page_num == 0:
+            fill_tab(scrolled, page_num)
+        else:
+            pending_tabs[page_num] = scrolled
+
+    for title in _TAB_TITLES:
+        create_tab(title)
+
+    notebook.connect("switch-page", on_switch_page)
+
+    # Hide rather than destroy so the next open skips the rebuild
+    builder.get_object('close_button').connect("clicked", lambda w: dialog.hide())
+    dialog.connect("delete-event", lambda d, e: d.hide_on_delete())
+    dialog.connect("destroy", _forget_help_dialog)
+
+    return dialog
@@ -8,7 +8,9 @@ import os
 # XET bypasses tqdm_class progress tracking, breaking our progress UI
 os.environ["HF_HUB_DISABLE_XET"] = "1"
 
+import json
 import threading
+import time
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
@@ -16,6 +18,11 @@ from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Download dialogs use the dark theme; set once rather than per dialog
+_settings = Gtk.Settings.get_default()
+if _settings:
+    _settings.set_property("gtk-application-prefer-dark-theme", True)
+
 # Model repository names on HuggingFace
 MODEL_REPOS = {
     "tiny": "Systran/faster-whisper-tiny",
@@ -25,6 +32,13 @@ MODEL_REPOS = {
     "large-v3": "Systran/faster-whisper-large-v3",
 }
 
+# Concurrent file downloads per model (see download_model_with_progress)
+_DOWNLOAD_WORKERS = 4
+
+# Seconds to wait before each retry of a failed file download. A retry
+# resumes from the partial .incomplete file instead of starting over.
+_RETRY_DELAYS = (1, 2, 4)
+
 # Model sizes for display (compressed size users will download)
 MODEL_DISPLAY_SIZES = {
     "tiny": "39 MB",
@@ -35,30 +49,184 @@ MODEL_DISPLAY_SIZES = {
 }
 
 
+# Models confirmed present in the HF cache this session. Only positive
+# results are remembered: another process (e.g. Preferences) may download a
+# model while we run, but cached models don't disappear from under us.
+_cached_models = set()
+
+# Files faster-whisper loads; all must be cached for a model to be usable
+_REQUIRED_MODEL_FILES = ("model.bin", "config.json", "tokenizer.json")
+
+# Repo files faster-whisper never reads (any *.md is skipped as well)
+_SKIP_FILES = frozenset({".gitattributes", "README.md"})
+
+
+def _files_to_download(manifest):
+    """
+    Pick the files to fetch from a repo manifest.
+
+    Args:
+        manifest: [(path, size), ...] from _get_repo_manifest()
+
+    Returns:
+        tuple: ([(path, size), ...], total_bytes)
+    """
+    files_with_sizes = []
+    total_bytes = 0
+    for path, size in manifest:
+        if not size:
+            continue
+        if path in _SKIP_FILES or path.endswith('.md'):
+            continue
+        files_with_sizes.append((path, size))
+        total_bytes += size
+    return files_with_sizes, total_bytes
+
+
+# Saved list_repo_tree results. The model repos change very rarely, so a
+# recent manifest is reused instead of another HTTPS round-trip, and an older
+# one is still used when the Hub can't be reached.
+_MANIFEST_DIR = os.path.expanduser("~/.cache/talktype/manifests")
+_MANIFEST_MAX_AGE = 7 * 24 * 3600  # seconds
+
+
+def _get_repo_manifest(repo_id):
+    """
+    Get the files in a model repo, from the on-disk cache when fresh.
+
+    Args:
+        repo_id: HuggingFace repo (e.g., "Systran/faster-whisper-small")
+
+    Returns:
+        list: [(path, size), ...] for every file in the repo
+
+    Raises:
+        Exception: If the Hub can't be reached and nothing is cached
+    """
+    manifest_path = os.path.join(_MANIFEST_DIR, repo_id.replace("/", "--") + ".json")
+    cached = None
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            cached = [(path, size) for path, size in json.load(f)]
+        if time.time() - os.path.getmtime(manifest_path) < _MANIFEST_MAX_AGE:
+            return cached
+    except (OSError, ValueError, TypeError):
+        pass
+
+    try:
+        from huggingface_hub import list_repo_tree
+        manifest = [
+            (f.path, f.size)
+            for f in list_repo_tree(repo_id, recursive=True)
+            if getattr(f, 'size', None) is not None  # folders have no size
+        ]
+    except Exception as e:
+        if cached:
+            logger.info(f"Using saved file list for {repo_id} (Hub unreachable: {e})")
+            return cached
+        raise
+
+    try:
+        os.makedirs(_MANIFEST_DIR, exist_ok=True)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.debug(f"Could not save file list for {repo_id}: {e}")
+    return manifest
+
+
 def is_model_cached(model_name):
     """
     Check if a Whisper model is already downloaded/cached.
 
+    Known models are checked by file presence in the HuggingFace cache (no
+    model weights are loaded); unknown names fall back to a local-only
+    WhisperModel load.
+
     Args:
         model_name: Model size (e.g., "tiny", "small", "medium", "large-v3")
 
     Returns:
         bool: True if model is cached, False otherwise
     """
-    try:
-        from faster_whisper import WhisperModel
-        # Try to load with local_files_only=True
-        # This will succeed if model is cached, fail if not
-        model = WhisperModel(
-            model_name,
-            device="cpu",
-            local_files_only=True
-        )
-        del model  # Clean up
+    if model_name in _cached_models:
         return True
+
+    repo_id = MODEL_REPOS.get(model_name)
+    try:
+        if repo_id:
+            from huggingface_hub import try_to_load_from_cache
+            # try_to_load_from_cache returns a path (str) only for files
+            # that are fully present in the cache
+            cached = all(
+                isinstance(try_to_load_from_cache(repo_id, f), str)
+                for f in _REQUIRED_MODEL_FILES
+            )
+        else:
+            from faster_whisper import WhisperModel
+            # Try to load with local_files_only=True
+            # This will succeed if model is cached, fail if not
+            model = WhisperModel(
+                model_name,
+                device="cpu",
+                local_files_only=True
+            )
+            del model  # Clean up
+            cached = True
     except Exception:
         return False
 
+    if cached:
+        _cached_models.add(model_name)
+    return cached
+
+
+def _hub_cache_dir():
+    """Path of the HuggingFace hub cache (honours HF_HOME / HF_HUB_CACHE)."""
+    try:
+        from huggingface_hub.constants import HF_HUB_CACHE
+        return HF_HUB_CACHE
+    except ImportError:
+        return os.path.expanduser("~/.cache/huggingface/hub")
+
+
+def get_cached_models():
+    """
+    Find every known model that is fully present in the HuggingFace cache.
+
+    One directory scan answers for all models at once, for UIs that show the
+    cache state of each model. Found models are remembered for
+    is_model_cached().
+
+    Returns:
+        set: Model names (e.g., {"tiny", "small"})
+    """
+    hub = _hub_cache_dir()
+    try:
+        entries = set(os.listdir(hub))
+    except OSError:
+        return set()
+
+    cached = set()
+    for model_name, repo_id in MODEL_REPOS.items():
+        repo_dir = "models--" + repo_id.replace("/", "--")
+        if repo_dir not in entries:
+            continue
+        snapshots = os.path.join(hub, repo_dir, "snapshots")
+        try:
+            revisions = os.listdir(snapshots)
+        except OSError:
+            continue
+        # Files are linked into a snapshot only once fully downloaded
+        if any(all(os.path.isfile(os.path.join(snapshots, rev, f)) for f in _REQUIRED_MODEL_FILES)
+               for rev in revisions):
+            cached.add(model_name)
+
+    _cached_models.update(cached)
+    return cached
+
 
 def is_model_cached_fast(model_name):
     """
@@ -81,8 +249,7 @@ def is_model_cached_fast(model_name):
         # config.json). Check the files faster-whisper actually loads —
         # hf_hub_download links a file into the snapshot only after its
         # download fully completes, so presence implies completeness.
-        required = ("model.bin", "config.json", "tokenizer.json")
-        return all(os.path.isfile(os.path.join(snapshot_path, f)) for f in required)
+        return all(os.path.isfile(os.path.join(snapshot_path, f)) for f in _REQUIRED_MODEL_FILES)
     except Exception:
         return False
 
@@ -105,7 +272,7 @@ def make_model_download_func(model_name):
     def download_func(progress_callback, cancel_event):
         """Download model files to HF cache only. Returns True on success."""
         try:
-            from huggingface_hub import hf_hub_download, list_repo_tree
+            from huggingface_hub import hf_hub_download
             from huggingface_hub.utils import disable_progress_bars
             import tqdm as tqdm_lib
 
@@ -121,13 +288,7 @@ def make_model_download_func(model_name):
 
             # Get all file names + sizes from the HuggingFace repo
             try:
-                files_info = list(list_repo_tree(repo_id, recursive=True))
-                files_with_sizes = [
-                    (f.path, f.size)
-                    for f in files_info
-                    if hasattr(f, 'size') and f.size is not None
-                ]
-                total_bytes = sum(size for _, size in files_with_sizes)
+                files_with_sizes, total_bytes = _files_to_download(_get_repo_manifest(repo_id))
                 logger.info(
                     f"Model {model_name}: {len(files_with_sizes)} files, "
                     f"{total_bytes / 1024 / 1024:.1f} MB total"
@@ -240,6 +401,123 @@ def make_model_download_func(model_name):
     return download_func
 
 
+class _ProgressState:
+    """Download progress shared between the download workers and the UI timer.
+
+    Workers add bytes under `lock` and publish `percent`/`file_info`; the UI
+    timer reads those and tracks what it last drew in `last_percent` /
+    `shown_file_info`.
+    """
+    __slots__ = ("total_bytes", "downloaded_bytes", "current_file", "percent",
+                 "file_info", "last_percent", "shown_file_info", "lock")
+
+    def __init__(self):
+        self.total_bytes = 0
+        self.downloaded_bytes = 0
+        self.current_file = ""
+        self.percent = 0
+        self.file_info = ""
+        self.last_percent = -1
+        self.shown_file_info = ""
+        self.lock = threading.Lock()
+
+
+def _warm_up_imports():
+    """Import faster_whisper off the GTK thread while a download dialog is up.
+
+    Its first import (ctranslate2, tokenizers) takes hundreds of ms; the
+    function-level imports below then find it in sys.modules.
+    """
+    try:
+        import faster_whisper  # noqa: F401
+    except Exception as e:
+        logger.debug(f"Import warm-up skipped: {e}")
+
+
+def _progress_tqdm_class(add_progress, cancel_event):
+    """Build the tqdm_class that feeds hf_hub_download progress to add_progress.
+
+    huggingface_hub retries a dropped connection itself, inside one
+    hf_hub_download call, and each retry opens a new bar starting at the
+    bytes already on disk. Bytes are therefore credited per worker thread
+    for the whole attempt: a resumed bar only adds what earlier bars have
+    not counted, and discard_attempt() takes back everything the attempt
+    added, whichever bar counted it.
+    """
+    import io
+    import tqdm
+
+    attempt = threading.local()
+
+    class GtkProgressTqdm(tqdm.tqdm):
+        """Custom tqdm that updates GTK progress bar"""
+        def __init__(self, *args, **kwargs):
+            # Store the file being downloaded
+            self._current_file = kwargs.get('desc', 'file')
+            # Pop 'name' kwarg that huggingface_hub passes but tqdm doesn't accept
+            kwargs.pop('name', None)
+            # CRITICAL: Force disable=False - tqdm sets disable=True when no TTY,
+            # but we're updating a GTK progress bar, not a terminal!
+            kwargs['disable'] = False
+            # Suppress console output - redirect to null device
+            kwargs['file'] = io.StringIO()
+            super().__init__(*args, **kwargs)
+            # A resumed download starts at the bytes already on disk; count
+            # the ones no earlier bar of this attempt has counted
+            credited = getattr(attempt, "credited", 0)
+            if self.n > credited:
+                add_progress(self.n - credited, f"Resuming {self._current_file}...")
+                attempt.credited = self.n
+
+        def update(self, n=1):
+            if cancel_event.is_set():
+                raise InterruptedError("Download cancelled")
+
+            # Call parent update
+            super().update(n)
+
+            attempt.credited = getattr(attempt, "credited", 0) + n
+            add_progress(n, f"Downloading {self._current_file}...")
+
+        @staticmethod
+        def begin_attempt():
+            """Start crediting a new download attempt on this thread."""
+            attempt.credited = 0
+
+        @staticmethod
+        def discard_attempt():
+            """Take a failed attempt's bytes back off the total."""
+            add_progress(-getattr(attempt, "credited", 0))
+            attempt.credited = 0
+
+    return GtkProgressTqdm
+
+
+# Progress bar labels, built once rather than formatted on every redraw
+_PERCENT_TEXT = [f"{i}%" for i in range(101)]
+
+
+def _poll_progress(progress_bar, status_label, progress_state, download_done):
+    """GLib timeout callback: copy download progress into the dialog widgets.
+
+    Runs on the main thread, so the download thread never schedules UI work
+    itself. Stops once the download is done (close_dialog shows 100%).
+    """
+    if download_done[0]:
+        return False
+    percent = int(progress_state.percent)
+    if percent != progress_state.last_percent:
+        progress_state.last_percent = percent
+        progress_bar.set_fraction(percent / 100.0)
+        progress_bar.set_text(_PERCENT_TEXT[percent])
+    file_info = progress_state.file_info
+    if file_info != progress_state.shown_file_info:
+        progress_state.shown_file_info = file_info
+        # Plain text: no Pango markup parse, and file names can't break it
+        status_label.set_text(file_info)
+    return True
+
+
 def download_model_with_progress(model_name, device="cpu", compute_type="int8", parent=None, show_confirmation=True):
     """
     Download a Whisper model with progress dialog.
@@ -254,8 +532,6 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
     Returns:
         WhisperModel instance or None if cancelled/failed
     """
-    from faster_whisper import WhisperModel
-
     # Check if already cached
     cached = is_model_cached(model_name)
     logger.info(f"Model cache check: {model_name} cached={cached}")
@@ -264,6 +540,7 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
     if cached:
         logger.info(f"Model {model_name} already cached, loading directly (no download window)")
         print(f"✅ Model {model_name} already cached - loading without download")
+        from faster_whisper import WhisperModel
         return WhisperModel(model_name, device=device, compute_type=compute_type)
 
     logger.info(f"Model {model_name} NOT cached - showing download progress dialog")
@@ -271,6 +548,25 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
 
     size_str = MODEL_DISPLAY_SIZES.get(model_name, "unknown size")
 
+    # Fetch the repo's file list while the user reads the confirmation dialog,
+    # so the download can start as soon as they click OK instead of waiting
+    # on another HTTPS round-trip
+    prefetched_files = [None]
+
+    def prefetch_file_list():
+        try:
+            prefetched_files[0] = _get_repo_manifest(MODEL_REPOS[model_name])
+        except Exception as e:
+            logger.debug(f"File list prefetch failed for {model_name}: {e}")
+
+    prefetch_thread = threading.Thread(target=prefetch_file_list, daemon=True)
+    if model_name in MODEL_REPOS:
+        prefetch_thread.start()
+
+    # Likewise import faster_whisper (ctranslate2, tokenizers) now, so the
+    # worker doesn't pay for it after the download
+    threading.Thread(target=_warm_up_imports, name="model-helper-warmup", daemon=True).start()
+
     # Show confirmation dialog before starting download
     if show_confirmation:
         confirm_dialog = Gtk.MessageDialog(
@@ -280,11 +576,6 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
             text=f"Download {model_name.title()} Model?"
         )
 
-        # Apply dark theme to dialog
-        settings = Gtk.Settings.get_default()
-        if settings:
-            settings.set_property("gtk-application-prefer-dark-theme", True)
-
         confirm_dialog.format_secondary_text(
             f"TalkType needs to download the {model_name} AI model ({size_str}) for speech recognition.\n\n"
             f"This is a one-time download that will be cached for future use.\n\n"
@@ -304,11 +595,6 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
     progress_dialog.set_modal(True)
     progress_dialog.set_position(Gtk.WindowPosition.CENTER)
 
-    # Apply dark theme to dialog
-    settings = Gtk.Settings.get_default()
-    if settings:
-        settings.set_property("gtk-application-prefer-dark-theme", True)
-
     if parent:
         progress_dialog.set_transient_for(parent)
 
@@ -326,7 +612,7 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
 
     # Status label
     status_label = Gtk.Label()
-    status_label.set_markup(f'<span>Downloading from Hugging Face... ({size_str})</span>')
+    status_label.set_text(f"Downloading from Hugging Face... ({size_str})")
     status_label.set_line_wrap(True)
     content.pack_start(status_label, False, False, 0)
 
@@ -358,27 +644,13 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
     download_done = [False]
 
     # Progress tracking state (shared between threads)
-    progress_state = {
-        'total_bytes': 0,
-        'downloaded_bytes': 0,
-        'current_file': '',
-        'last_percent': -1
-    }
+    progress_state = _ProgressState()
 
     def update_ui_progress(percent, file_info=""):
-        """Update progress bar from main thread"""
-        # Only update if percent changed (reduces UI updates)
-        if int(percent) == progress_state['last_percent']:
-            return
-        progress_state['last_percent'] = int(percent)
-
-        def do_update():
-            progress_bar.set_fraction(percent / 100.0)
-            progress_bar.set_text(f"{int(percent)}%")
-            if file_info:
-                status_label.set_markup(f'<span>{file_info}</span>')
-            return False
-        GLib.idle_add(do_update)
+        """Record progress for the UI timer (safe from any thread)"""
+        progress_state.percent = percent
+        if file_info:
+            progress_state.file_info = file_info
 
     def do_download():
         """Download model files with byte-level progress tracking"""
@@ -386,12 +658,13 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
             if cancel_event.is_set():
                 return
 
+            from faster_whisper import WhisperModel
+
             logger.info(f"Downloading model {model_name} using huggingface_hub")
 
             # Import huggingface_hub
-            from huggingface_hub import hf_hub_download, list_repo_tree
+            from huggingface_hub import hf_hub_download, try_to_load_from_cache
             from huggingface_hub.utils import disable_progress_bars
-            import tqdm
 
             # Disable huggingface_hub's console progress bars
             disable_progress_bars()
@@ -400,13 +673,17 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
             if not repo_id:
                 raise ValueError(f"Unknown model: {model_name}")
 
-            # Get list of files with sizes
+            # Get list of files with sizes (usually already prefetched while
+            # the confirmation dialog was open)
             try:
-                files_info = list(list_repo_tree(repo_id, recursive=True))
-                # Filter to only files (not directories)
-                files_with_sizes = [(f.path, f.size) for f in files_info if hasattr(f, 'size') and f.size is not None]
-                total_bytes = sum(size for _, size in files_with_sizes)
-                progress_state['total_bytes'] = total_bytes
+                if prefetch_thread.is_alive():
+                    prefetch_thread.join(timeout=5.0)
+                manifest = prefetched_files[0]
+                if manifest is None:
+                    manifest = _get_repo_manifest(repo_id)
+                # Filter to only files (not directories) the model needs
+                files_with_sizes, total_bytes = _files_to_download(manifest)
+                progress_state.total_bytes = total_bytes
                 logger.info(f"Model {model_name}: {len(files_with_sizes)} files, {total_bytes / 1024 / 1024:.1f} MB total")
             except Exception as e:
                 logger.warning(f"Could not get file sizes: {e}")
@@ -425,67 +702,93 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
                 download_result[0] = model
                 return
 
-            # Create custom tqdm class that updates our progress bar
-            class GtkProgressTqdm(tqdm.tqdm):
-                """Custom tqdm that updates GTK progress bar"""
-                def __init__(self, *args, **kwargs):
-                    import io
-                    # Store the file being downloaded
-                    self._current_file = kwargs.get('desc', 'file')
-                    # Pop 'name' kwarg that huggingface_hub passes but tqdm doesn't accept
-                    kwargs.pop('name', None)
-                    # CRITICAL: Force disable=False - tqdm sets disable=True when no TTY,
-                    # but we're updating a GTK progress bar, not a terminal!
-                    kwargs['disable'] = False
-                    # Suppress console output - redirect to null device
-                    kwargs['file'] = io.StringIO()
-                    super().__init__(*args, **kwargs)
-
-                def update(self, n=1):
-                    if cancel_event.is_set():
-                        raise InterruptedError("Download cancelled")
-
-                    # Call parent update
-                    super().update(n)
-
-                    # Update downloaded bytes
-                    progress_state['downloaded_bytes'] += n
-
-                    # Calculate overall progress
-                    if progress_state['total_bytes'] > 0:
-                        percent = (progress_state['downloaded_bytes'] / progress_state['total_bytes']) * 95
-                        percent = min(95, percent)  # Cap at 95% until model loads
-                        update_ui_progress(percent, f"Downloading {self._current_file}...")
-
-            # Download each file with progress tracking
-            for filename, file_size in files_with_sizes:
+            # Several files download at once, so the shared byte counter is
+            # updated under the state's lock
+            def add_progress(n, file_info=None):
+                with progress_state.lock:
+                    progress_state.downloaded_bytes += n
+                    downloaded = progress_state.downloaded_bytes
+                # Calculate overall progress
+                if file_info and progress_state.total_bytes > 0:
+                    percent = (downloaded / progress_state.total_bytes) * 95
+                    percent = min(95, percent)  # Cap at 95% until model loads
+                    update_ui_progress(percent, file_info)
+
+            GtkProgressTqdm = _progress_tqdm_class(add_progress, cancel_event)
+
+            def fetch_file(filename, file_size):
                 if cancel_event.is_set():
                     raise InterruptedError("Download cancelled")
 
-                progress_state['current_file'] = filename
-                bytes_before = progress_state['downloaded_bytes']
+                # Already in the cache - count it without a network round-trip
+                if isinstance(try_to_load_from_cache(repo_id, filename), str):
+                    add_progress(file_size, f"Loaded from cache: {filename}")
+                    return
 
+                progress_state.current_file = filename
                 try:
-                    # Download with our custom tqdm class
-                    hf_hub_download(
-                        repo_id=repo_id,
-                        filename=filename,
-                        tqdm_class=GtkProgressTqdm,
-                    )
-                    # If no progress updates happened, file was cached - update manually
-                    if progress_state['downloaded_bytes'] == bytes_before:
-                        progress_state['downloaded_bytes'] += file_size
-                        if progress_state['total_bytes'] > 0:
-                            percent = (progress_state['downloaded_bytes'] / progress_state['total_bytes']) * 95
-                            percent = min(95, percent)
-                            update_ui_progress(percent, f"Loaded from cache: {filename}")
+                    for attempt, delay in enumerate(_RETRY_DELAYS + (None,)):
+                        GtkProgressTqdm.begin_attempt()
+                        try:
+                            # Download with our custom tqdm class
+                            hf_hub_download(
+                                repo_id=repo_id,
+                                filename=filename,
+                                tqdm_class=GtkProgressTqdm,
+                            )
+                            break
+                        except InterruptedError:
+                            raise
+                        except Exception as e:
+                            GtkProgressTqdm.discard_attempt()
+                            if delay is None:
+                                raise
+                            logger.info(f"Retrying {filename} in {delay}s "
+                                        f"(attempt {attempt + 1} failed: {e})")
+                            if cancel_event.wait(delay):
+                                raise InterruptedError("Download cancelled")
                 except InterruptedError:
                     raise
                 except Exception as e:
                     # Some files might already be cached or optional
                     logger.warning(f"Error downloading {filename}: {e}")
                     # Add file size to downloaded bytes anyway (might be cached)
-                    progress_state['downloaded_bytes'] += file_size
+                    add_progress(file_size)
+
+            # Download the repo's files concurrently (a Whisper repo is a
+            # handful of small files plus model.bin) so per-file request
+            # latency overlaps instead of adding up. Per-file hf_hub_download
+            # is kept over snapshot_download because snapshot_download does
+            # not pass tqdm_class to the individual file downloads, which
+            # would lose byte-level progress on the multi-GB model.bin.
+            # Daemon threads rather than a ThreadPoolExecutor: executor
+            # workers are joined at interpreter exit, so after Cancel a
+            # stalled socket would keep the process alive until its read
+            # timeout.
+            pending = list(reversed(files_with_sizes))
+            pending_lock = threading.Lock()
+            fetch_errors = []
+
+            def fetch_worker():
+                while True:
+                    with pending_lock:
+                        if not pending or fetch_errors:
+                            return
+                        filename, file_size = pending.pop()
+                    try:
+                        fetch_file(filename, file_size)
+                    except BaseException as e:
+                        fetch_errors.append(e)
+                        return
+
+            workers = [threading.Thread(target=fetch_worker, daemon=True)
+                       for _ in range(min(_DOWNLOAD_WORKERS, len(files_with_sizes)))]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if fetch_errors:
+                raise fetch_errors[0]  # InterruptedError on cancel
 
             if cancel_event.is_set():
                 return
@@ -523,13 +826,24 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
             return False
         GLib.idle_add(close_dialog)
 
-    # Start download thread
-    download_thread = threading.Thread(target=do_download)
-    download_thread.daemon = True
+    # Start the download on a daemon thread (results come back through the
+    # holders above); the main thread only ever polls it, so GTK keeps
+    # processing events while the model loads, and a cancelled download
+    # stuck on a stalled socket can't hold up interpreter exit
+    download_thread = threading.Thread(target=do_download, name="model-download", daemon=True)
     download_thread.start()
 
+    # Redraw progress at a fixed 10 Hz, however fast updates arrive. Low
+    # priority so GTK's own redraws and input always run first; close_dialog
+    # keeps the default priority so the final 100% frame isn't delayed.
+    timer_id = GLib.timeout_add(
+        100, _poll_progress, progress_bar, status_label, progress_state, download_done,
+        priority=GLib.PRIORITY_LOW)
+
     # Run dialog
     response = progress_dialog.run()
+    if not download_done[0]:
+        GLib.source_remove(timer_id)  # (a finished timer already removed itself)
     progress_dialog.destroy()
 
     # Check if cancelled
@@ -538,8 +852,12 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
         cancel_event.set()
         return None
 
-    # Wait for download to complete
-    download_thread.join()
+    # Wait for the worker to wind down without blocking the main loop; the
+    # 50 ms timeout wakes main_iteration() even when no events arrive
+    if download_thread.is_alive():
+        GLib.timeout_add(50, download_thread.is_alive)
+        while download_thread.is_alive():
+            Gtk.main_iteration()
 
     # Check for errors
     if download_error[0]:
@@ -550,11 +868,6 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
             text="Model Download Failed"
         )
 
-        # Apply dark theme
-        settings = Gtk.Settings.get_default()
-        if settings:
-            settings.set_property("gtk-application-prefer-dark-theme", True)
-
         msg.format_secondary_text(
             f"Could not download {model_name} model.\n\n"
             f"Error: {str(download_error[0])}\n\n"
@@ -565,3 +878,4 @@ def download_model_with_progress(model_name, device="cpu", compute_type="int8",
         return None
 
     return download_result[0]
+
@@ -1,3 +1,4 @@
+import functools
 import re
 
 # =====================================================================
@@ -5,6 +6,13 @@ import re
 # This avoids recompiling 40+ patterns on every dictation call.
 # =====================================================================
 
+# Line breaks leave normalize_text() as the "§SHIFT_ENTER§" marker (app.py
+# turns it into Shift+Enter keypresses). Inside the pipeline they are a
+# single private-use character instead, so the newline swaps around the
+# capitalization passes are one-character replaces.
+SHIFT_ENTER_MARKER = "§SHIFT_ENTER§"
+_SHIFT_ENTER = "\uE000"
+
 # --- 0) Quoted text protection ---
 _RE_QUOTED_TEXT = re.compile(
     r'\b(?:open\s+quotes?)[,.\s]+(.*?)[,.\s]+(?:close\s+quotes?)\b',
@@ -39,12 +47,27 @@ LITERAL_REPLACEMENTS = {
 
 # Restore mapping: each placeholder → its original spoken word (1:1, lossless)
 LITERAL_RESTORE = {ph: word for word, ph in LITERAL_REPLACEMENTS.items()}
+# Any placeholder, so step 12 restores them all in one scan
+_RE_LITERAL_PLACEHOLDER = re.compile("|".join(re.escape(ph) for ph in LITERAL_RESTORE))
+# Quoted-section placeholders, restored (step 13) after the re-capitalization
+# so quoted text keeps its case
+_RE_QUOTED_PLACEHOLDER = re.compile(r"__QUOTED_(\d+)__")
+# Prebuilt placeholders for the usual handful of quoted sections
+_QUOTED_PLACEHOLDERS = tuple(f"__QUOTED_{i}__" for i in range(16))
+
+# Literal escapes: "literal <word>" or "the word <word>", all escapable words
+# in one alternation so the text is scanned once. Longest words first so a
+# word is never cut short by a shorter alternative.
+_RE_LITERAL_ESCAPE = re.compile(
+    r"\b(?:literal|the\s+words?)\s+("
+    + "|".join(re.escape(word) for word in sorted(LITERAL_REPLACEMENTS, key=len, reverse=True))
+    + r")\b",
+    re.IGNORECASE,
+)
 
-# Precompile literal escape patterns: "literal <word>" or "the word <word>"
-_LITERAL_PATTERNS = [
-    (re.compile(rf"\b(?:literal|the\s+words?)\s+{re.escape(word)}\b", re.IGNORECASE), placeholder)
-    for word, placeholder in LITERAL_REPLACEMENTS.items()
-]
+
+def _literal_escape_repl(m: re.Match) -> str:
+    return LITERAL_REPLACEMENTS[m.group(1).lower()]
 
 # --- 0.2) Context-aware protection for command words used as English nouns ---
 # Words like "period", "comma", "return", "dash", "quote" are command triggers
@@ -53,7 +76,7 @@ _LITERAL_PATTERNS = [
 # pass, those phrases get corrupted: "period of time" → "period. Of time".
 #
 # Each pattern captures surrounding context and substitutes a placeholder for
-# just the protected word. Same mechanism as _LITERAL_PATTERNS — placeholders
+# just the protected word. Same mechanism as _RE_LITERAL_ESCAPE — placeholders
 # are restored to their original words by the pass at step 12.
 _CONTEXT_PROTECT_PATTERNS = [
     # "[article/adj/possessive] period" — strong noun signal
@@ -137,9 +160,10 @@ _CONTEXT_PROTECT_PATTERNS = [
 
 # --- 1) Multi-word spoken punctuation → symbol ---
 _MULTI_WORD_REPLACEMENTS = [
-    (re.compile(r"\s*\bnew\s*line\b[,.\s]*|\bnewline\b|\breturn\b|\bline\s+break\b", re.IGNORECASE), "§SHIFT_ENTER§"),
-    (re.compile(r"[,.\s]*\bnew\s+paragraph\b[,.\s]*|\bparagraph\s+break\b[,.\s]*", re.IGNORECASE), "§SHIFT_ENTER§§SHIFT_ENTER§"),
-    (re.compile(r"[,.\s]*\bsoft\s+break\b[,.\s]*|\bsoft\s+line\b[,.\s]*", re.IGNORECASE), "   "),
+    (re.compile(r"\s*\bnew\s*line\b[,.\s]*|\bnewline\b|\breturn\b|\bline\s+break\b", re.IGNORECASE), _SHIFT_ENTER),
+    (re.compile(r"[,.\s]*\bnew\s+paragraph\b[,.\s]*|\bparagraph\s+break\b[,.\s]*", re.IGNORECASE), _SHIFT_ENTER * 2),
+    # "soft line break" is "soft" + a line break: "line break" (above) has priority
+    (re.compile(r"[,.\s]*\bsoft\s+break\b[,.\s]*|\bsoft\s+line\b(?!\s+break\b)[,.\s]*", re.IGNORECASE), "   "),
     (re.compile(r"\btab\b", re.IGNORECASE), "\t"),
     (re.compile(r"\bexclamation\s+point\b|\bexclamation\s+mark\b", re.IGNORECASE), "!"),
     (re.compile(r"\bquestion\s+mark\b", re.IGNORECASE), "?"),
@@ -169,13 +193,69 @@ _SINGLE_WORD_REPLACEMENTS = [
     (re.compile(r"\bhyphen\b|\bdash\b", re.IGNORECASE), "-"),
 ]
 
+# Every trigger word stages 0-2 can act on. Utterances with none of these
+# (most plain dictation) skip the quoted/literal/context/replacement passes
+# and the matching restore passes entirely; the tidy-up, capitalization,
+# email and time stages still run, so the output is unchanged.
+_RE_COMMAND_WORD = re.compile(
+    r"\b(?:period|comma|semicolon|colon|apostrophe|quotes?|hyphen|em\s*dash|dash|"
+    r"tab|new\s*line|return|line\s+break|paragraph|soft\s+(?:break|line)|"
+    r"exclamation|question\s+mark|full\s*stop|dot\s+dot\s+dot|ellipsis|"
+    r"parenthesis|bracket|brace)\b",
+    re.IGNORECASE,
+)
+
+
+def _fuse_replacements(replacements):
+    """Fuse an ordered [(pattern, repl), ...] list into few alternations.
+
+    Returns a list of (compiled, repls) stages: each pattern becomes the
+    named group r<i> of its stage and repls[i] is its replacement, so
+    _fused_sub() scans once per stage instead of once per pattern. List
+    order is kept as alternation order, so earlier entries still win where
+    two could match at the same position (e.g. "em dash" before the bare
+    "dash"). A replacement that inserts whitespace ("tab" -> "\\t") ends its
+    stage: later patterns' \\s may match across what it produced, exactly as
+    with one sub() per pattern ("open tab brace" -> "{").
+    """
+    stages, current = [], []
+    for pat, repl in replacements:
+        current.append((pat, repl))
+        if repl.isspace():
+            stages.append(current)
+            current = []
+    if current:
+        stages.append(current)
+    return [
+        (
+            re.compile(
+                "|".join(f"(?P<r{i}>{pat.pattern})" for i, (pat, _repl) in enumerate(stage)),
+                re.IGNORECASE,
+            ),
+            tuple(repl for _pat, repl in stage),
+        )
+        for stage in stages
+    ]
+
+
+def _fused_sub(fused, text: str) -> str:
+    for compiled, repls in fused:
+        text = compiled.sub(lambda m: repls[int(m.lastgroup[1:])], text)
+    return text
+
+
+# Multi-word rules come first, so they keep priority over the single words
+# they contain ("close quote" before "quote"). Fusing yields three stages:
+# line breaks, "tab", then every remaining rule in one scan.
+_COMMAND_WORD_FUSED = _fuse_replacements(_MULTI_WORD_REPLACEMENTS + _SINGLE_WORD_REPLACEMENTS)
+
 # --- 3) Quotes/brackets spacing ---
-_RE_OPEN_BRACKET_SPACE = re.compile(r"(\(|\[|\{)\s+")
-_RE_SPACE_CLOSE_BRACKET = re.compile(r"\s+(\)|\]|\})")
-_RE_OPEN_SMART_QUOTE_SPACE = re.compile(r"(\u201c)\s+")
-_RE_SPACE_CLOSE_SMART_QUOTE = re.compile(r"\s+(\u201d)")
-_RE_OPEN_QUOTE_COMMA = re.compile(r"\u201c\s*,+")
-_RE_COMMA_CLOSE_QUOTE = re.compile(r",+\s*\u201d")
+# Whitespace inside brackets and smart quotes, then stray commas inside
+# smart quotes. One alternation each: only one of the two groups takes
+# part in a match, and \1\2 expands the other to "". The comma pass must
+# stay separate, since it cleans up what the space pass uncovers ("“ , x").
+_RE_BRACKET_SPACE = re.compile(r"([(\[{\u201c])\s+|\s+([)\]}\u201d])")
+_RE_QUOTE_COMMA = re.compile(r"(\u201c)\s*,+|,+\s*(\u201d)")
 
 # --- 4) Space before punctuation ---
 _RE_SPACE_BEFORE_PUNCT = re.compile(r"\s+([,;:.?!…—-])")
@@ -189,6 +269,10 @@ _RE_COMMA_BEFORE_PERIOD = re.compile(r",\s*\.")
 _RE_MULTIPLE_COMMAS = re.compile(r",\s*,+")
 _RE_DASH_COLON = re.compile(r"-\s*:")
 _RE_COLON_DASH = re.compile(r":\s*-")
+# Every combo rule needs one of these pairs. When none is present no rule
+# can fire (none fires, so none creates a match for the next), and the
+# usual dictated sentence gets one scan instead of eight.
+_RE_PUNCT_COMBO = re.compile(r"[,;:!?-]\s*[.?!…,:-]")
 
 # --- 6) Collapse punctuation runs ---
 _RE_MANY_DOTS = re.compile(r"\.{4,}")
@@ -205,15 +289,43 @@ _RE_HYPHEN_SPACE = re.compile(r"\s*-\s*")
 # --- 9) Tidy spaces around newlines ---
 _RE_SPACE_BEFORE_NEWLINE = re.compile(r"[ \t]+\n")
 _RE_SPACE_AFTER_NEWLINE = re.compile(r"\n[ ]+")
-_RE_LEADING_PUNCT = re.compile(r"^[\s]*[\.,;:!?]+(?!…)")
+# Per-line tidy, applied to the whole text at once ((?m): ^/$ at each line;
+# [^\S\n] is whitespace that doesn't cross into the next line)
+_RE_LEADING_PUNCT = re.compile(r"(?m)^[^\S\n]*[\.,;:!?]+(?!…)")
+_RE_TABS_THEN_SPACES = re.compile(r"(?m)^(\t*) +")
 _RE_MULTI_SPACE = re.compile(r"[ ]{2,}")
+_RE_TRAILING_LINE_WS = re.compile(r"(?m)[^\S\n]+$")
 
 # --- 10) Capitalization ---
-_RE_TRAILING_COMMA = re.compile(r",$")
-_RE_NO_END_PUNCT = re.compile(r"[.?!…]$")
+# Applied to the whole text with line-break markers swapped for "\n"; every rule
+# works per line.
+# First letter of a line. [^\W\d_] is a word character that isn't a digit or
+# underscore: any letter, but also a rare numeric such as "½", which
+# _cap_line_start() steps over.
+_RE_LINE_FIRST_LETTER = re.compile(r"(?m)^([^\n]*?)([^\W\d_])(.*)")
+_RE_FIRST_LETTER = re.compile(r"[^\W\d_]")
+_RE_TRAILING_COMMA = re.compile(r"(?m),$")
+# Last non-space character of a non-blank line, when it isn't a sentence ender
+_RE_NO_END_PUNCT = re.compile(r"(?m)([^\s.?!…])[^\S\n]*$")
 # Negative lookbehind: don't capitalize after single-letter abbreviations
 # ("e.g. that" / "U.S. economy" must not become "e.g. That" / "U.S. Economy").
-_RE_CAP_AFTER_ENDER = re.compile(r"(?<![A-Za-z]\.[A-Za-z])([.?!…]\s+)([a-z])")
+_RE_CAP_AFTER_ENDER = re.compile(r"(?<![A-Za-z]\.[A-Za-z])([.?!…][^\S\n]+)([a-z])")
+
+
+def _cap_after_ender(m: re.Match) -> str:
+    """Uppercase the letter matched by _RE_CAP_AFTER_ENDER."""
+    return m.group(1) + m.group(2).upper()
+
+
+def _cap_line_start(m: re.Match) -> str:
+    """Uppercase the first letter of a line matched by _RE_LINE_FIRST_LETTER."""
+    head, ch, rest = m.groups()
+    while not ch.isalpha():
+        nxt = _RE_FIRST_LETTER.search(rest)
+        if nxt is None:
+            return m.group(0)
+        head, ch, rest = head + ch + rest[:nxt.start()], nxt.group(), rest[nxt.end():]
+    return head + ch.upper() + rest
 # Standalone lowercase "i" → "I" (also catches "i'll", "i'm", "i've", "i'd"
 # because the apostrophe is a word boundary). Case-sensitive: an existing
 # "I" is left alone. Words like "in", "it", "iPad" are not matched because
@@ -224,25 +336,29 @@ _RE_STANDALONE_I = re.compile(r"\bi\b")
 _RE_PUNCT_OUTSIDE_QUOTE = re.compile(r"\u201d( ?)([!?,;:.])")
 
 # --- 14) Email/URL formatting ---
+# Cheap pre-check for _RE_EMAIL_AT_WORD, whose leading [..]+\s+at scan is
+# the slowest pattern in the module: no spoken " at ", no email to rebuild
+_RE_SPOKEN_AT = re.compile(r"\sat\s", re.IGNORECASE)
 _RE_EMAIL_AT_WORD = re.compile(
     r"([a-zA-Z0-9._-]+)\s+at\s+([a-zA-Z0-9.-]+)\s*\.\s*"
     r"(com|org|net|edu|gov|io|co|uk|ca|de|fr|us|au|jp|cn|in|br|mx|ru|kr|es|it|nl|se|no|fi|pl|cz|hu|ro|gr|pt|ie|nz|za|ae|il|tr|th|vn|ph|id|my|sg|hk|tw)\b",
     re.IGNORECASE
 )
-_EMAIL_TLD_FIXES = [
-    (re.compile(r"@\s+"), "@"),
-    (re.compile(r"\.\s*([Cc]om)\b"), ".com"),
-    (re.compile(r"\.\s*([Oo]rg)\b"), ".org"),
-    (re.compile(r"\.\s*([Nn]et)\b"), ".net"),
-    (re.compile(r"\.\s*([Ee]du)\b"), ".edu"),
-    (re.compile(r"\.\s*([Gg]ov)\b"), ".gov"),
-    (re.compile(r"\.\s*([Ii]o)\b"), ".io"),
-    (re.compile(r"\.\s*([Cc]o)\b"), ".co"),
-    (re.compile(r"\.\s*([Uu]k)\b"), ".uk"),
-    (re.compile(r"\.\s*([Cc]a)\b"), ".ca"),
-    (re.compile(r"\.\s*([Dd]e)\b"), ".de"),
-    (re.compile(r"\.\s*([Ff]r)\b"), ".fr"),
-]
+# TLDs rejoined to a preceding dot (". com" -> ".com"). Deliberately short:
+# this pass runs on all text, and TLDs such as "in"/"it"/"no" would glue
+# ordinary sentences together ("home. It was" -> "home.it was").
+_VALID_TLDS = frozenset({"com", "org", "net", "edu", "gov", "io", "co", "uk", "ca", "de", "fr"})
+# "@ " → "@", and ". com" → ".com" in the same scan. TLD: first letter
+# either case, rest lowercase ("Com" / "com", not "COM").
+_RE_EMAIL_SPACING = re.compile(r"@\s+|\.\s*([A-Za-z][a-z]{1,2})\b")
+
+
+def _fix_email_spacing(m: re.Match) -> str:
+    tld = m.group(1)
+    if tld is None:
+        return "@"
+    tld = tld.lower()
+    return "." + tld if tld in _VALID_TLDS else m.group(0)
 
 # --- 15) Time formatting ---
 # Fix Whisper's mangled time output: "11. 30 p. m." → "11:30 PM", "11 p. m." → "11 PM"
@@ -255,11 +371,14 @@ _RE_TIME_FORMAT = re.compile(
     re.IGNORECASE
 )
 
+# Dots/spaces inside a spoken AM/PM ("p. m." → "pm")
+_RE_AMPM_SEPARATORS = re.compile(r"[\s.]")
+
 def _fix_time_ampm(m: re.Match) -> str:
     """Normalize a matched time string to HH:MM AM/PM or HH AM/PM format."""
     hour = m.group(1)
     minute = m.group(2)  # None if no minutes were present
-    ampm = re.sub(r'[\s.]', '', m.group(3)).upper()  # "p. m." / "p. M." → "PM"
+    ampm = _RE_AMPM_SEPARATORS.sub('', m.group(3)).upper()  # "p. m." / "p. M." → "PM"
     if minute:
         return f"{hour}:{minute} {ampm}"
     return f"{hour} {ampm}"
@@ -286,6 +405,54 @@ def _space_after_ender_repl(m: re.Match) -> str:
     return ch + " "
 
 
+# Stages 3-9 up to the per-line pass are plain ordered substitutions; they
+# run as one table-driven loop over these phases.
+_RE_TRIPLE_DOT = re.compile(r"\.\.\.")
+
+_PHASE_BRACKETS = (  # 3) quotes/brackets spacing
+    (_RE_BRACKET_SPACE, r"\1\2"),
+    (_RE_QUOTE_COMMA, r"\1\2"),
+)
+_PHASE_SPACE_BEFORE_PUNCT = (  # 4) remove spaces before punctuation
+    (_RE_SPACE_BEFORE_PUNCT, r"\1"),
+)
+_PHASE_PUNCT_COMBOS = (  # 5) normalize punctuation combos
+    (_RE_WEAK_BEFORE_STRONG, r"\1"),
+    (_RE_PERIOD_AFTER_BANG_Q, r"\1"),
+    (_RE_COMMA_AFTER_BANG_Q, r"\1"),
+    (_RE_COMMAS_BEFORE_BANG_Q, r"\1"),
+    (_RE_COMMA_BEFORE_PERIOD, "."),
+    (_RE_MULTIPLE_COMMAS, ","),
+    (_RE_DASH_COLON, ":"),
+    (_RE_COLON_DASH, ":"),
+)
+_PHASE_PUNCT_RUNS = (  # 6) collapse punctuation runs; handle ellipsis
+    (_RE_MANY_DOTS, "…"),
+    (_RE_DOUBLE_DOT, "."),
+    (_RE_REPEATED_BANG_Q, r"\1"),
+    (_RE_TRIPLE_DOT, "…"),
+)
+_PHASE_SPACING = (
+    # 7) one space after sentence enders (the callable skips decimals like
+    #    3.5 and abbreviations like U.S.)
+    (_RE_SPACE_AFTER_ENDER, _space_after_ender_repl),
+    # 8) em dash spacing; tight hyphens
+    (_RE_EM_DASH_SPACE, " — "),
+    (_RE_HYPHEN_SPACE, "-"),
+    # 9) tidy spaces around newlines
+    (_RE_SPACE_BEFORE_NEWLINE, "\n"),
+    (_RE_SPACE_AFTER_NEWLINE, "\n"),
+)
+# (gate, rules): a phase whose gate doesn't match is skipped
+_TIDY_PHASES = (
+    (None, _PHASE_BRACKETS),
+    (None, _PHASE_SPACE_BEFORE_PUNCT),
+    (_RE_PUNCT_COMBO, _PHASE_PUNCT_COMBOS),
+    (None, _PHASE_PUNCT_RUNS),
+    (None, _PHASE_SPACING),
+)
+
+
 # Trailing line-break markers (possibly repeated) at the end of an utterance.
 _RE_TRAILING_BREAKS = re.compile(r"(?:\s*(?:§SHIFT_ENTER§))+\s*$")
 
@@ -319,146 +486,136 @@ def append_auto_punct(text: str, auto_period: bool, auto_space: bool) -> str:
 # Main normalization function
 # =====================================================================
 
+# Pure function of its input, so repeated utterances ("new line", "period",
+# a retried phrase) are served from the cache instead of re-running the pipeline.
+@functools.lru_cache(maxsize=1024)
 def normalize_text(text: str) -> str:
     """Spoken punctuation -> symbols; tidy punctuation; auto-capitalize; keep newlines/tabs."""
+    # A lone spoken command ("comma", "New line", " period ") is the most
+    # common short utterance; answer it without running the full pipeline
+    if len(text) < 32:
+        hit = _SHORT_COMMANDS.get(text.strip(" ").lower())
+        if hit is not None:
+            return hit
+    return _normalize_pipeline(text)
+
+
+def _normalize_pipeline(text: str) -> str:
     if not text:
         return text
-
-    # --- 0) Handle quoted text - preserve everything inside quotes as literal ---
-    quoted_sections = []
-    def save_quoted(match):
-        quoted_sections.append(match.group(1))
-        return f"__QUOTED_{len(quoted_sections)-1}__"
-
-    text = _RE_QUOTED_TEXT.sub(save_quoted, text)
-
-    # --- 0.1) Escape sequences for literal words ---
-    for pat, placeholder in _LITERAL_PATTERNS:
-        text = pat.sub(placeholder, text)
-
-    # --- 0.2) Protect command words used as English nouns ("period of time",
-    #          "in return", "a dash of salt", "comma operator", etc.) ---
-    for pat, repl in _CONTEXT_PROTECT_PATTERNS:
-        text = pat.sub(repl, text)
-
-    # --- 1) Multi-word replacements first (order matters) ---
-    for pat, repl in _MULTI_WORD_REPLACEMENTS:
-        text = pat.sub(repl, text)
-
-    # --- 2) Single-word replacements ---
-    for pat, repl in _SINGLE_WORD_REPLACEMENTS:
-        text = pat.sub(repl, text)
-
-    # --- 3) Quotes/brackets spacing ---
-    text = _RE_OPEN_BRACKET_SPACE.sub(r"\1", text)
-    text = _RE_SPACE_CLOSE_BRACKET.sub(r"\1", text)
-    text = _RE_OPEN_SMART_QUOTE_SPACE.sub(r"\1", text)
-    text = _RE_SPACE_CLOSE_SMART_QUOTE.sub(r"\1", text)
-    text = _RE_OPEN_QUOTE_COMMA.sub("\u201c", text)
-    text = _RE_COMMA_CLOSE_QUOTE.sub("\u201d", text)
-
-    # --- 4) Remove spaces before punctuation ---
-    text = _RE_SPACE_BEFORE_PUNCT.sub(r"\1", text)
-
-    # --- 5) Normalize punctuation combos ---
-    text = _RE_WEAK_BEFORE_STRONG.sub(r"\1", text)
-    text = _RE_PERIOD_AFTER_BANG_Q.sub(r"\1", text)
-    text = _RE_COMMA_AFTER_BANG_Q.sub(r"\1", text)
-    text = _RE_COMMAS_BEFORE_BANG_Q.sub(r"\1", text)
-    text = _RE_COMMA_BEFORE_PERIOD.sub(".", text)
-    text = _RE_MULTIPLE_COMMAS.sub(",", text)
-    text = _RE_DASH_COLON.sub(":", text)
-    text = _RE_COLON_DASH.sub(":", text)
-
-    # --- 6) Collapse punctuation runs; handle ellipsis ---
-    text = _RE_MANY_DOTS.sub("…", text)
-    text = _RE_DOUBLE_DOT.sub(".", text)
-    text = _RE_REPEATED_BANG_Q.sub(r"\1", text)
-    text = text.replace("...", "…")
-
-    # --- 7) Ensure one space after sentence enders ---
-    # (callable repl skips decimals like 3.5 and abbreviations like U.S.)
-    text = _RE_SPACE_AFTER_ENDER.sub(_space_after_ender_repl, text)
-
-    # --- 8) Em dash spacing; tight hyphens ---
-    text = _RE_EM_DASH_SPACE.sub(" — ", text)
-    text = _RE_HYPHEN_SPACE.sub("-", text)
-
-    # --- 9) Tidy spaces around newlines ---
-    text = _RE_SPACE_BEFORE_NEWLINE.sub("\n", text)
-    text = _RE_SPACE_AFTER_NEWLINE.sub("\n", text)
-
-    lines = []
-    for raw_line in text.split("\n"):
-        # Strip leading stray punctuation (keep ellipsis and quotes/parens)
-        line = _RE_LEADING_PUNCT.sub("", raw_line)
-
-        leading_tabs = len(line) - len(line.lstrip("\t"))
-        core = line.lstrip("\t")
-        core = core.lstrip(" ")
-        core = _RE_MULTI_SPACE.sub(" ", core)
-        line = ("\t" * leading_tabs) + core
-        lines.append(line.rstrip())
-    text = "\n".join(lines)
+    if SHIFT_ENTER_MARKER in text:
+        text = text.replace(SHIFT_ENTER_MARKER, _SHIFT_ENTER)
+
+    # Stages 0-2 (and their restores in 12-13) only act on spoken commands
+    has_commands = _RE_COMMAND_WORD.search(text) is not None
+
+    if has_commands:
+        # --- 0) Handle quoted text - preserve everything inside quotes as literal ---
+        quoted_sections = []
+
+        # Substring pre-check: the lazy (.*?) scan is costly and most
+        # utterances never say "open quote"
+        if "open" in text.lower():
+            def save_quoted(match, _append=quoted_sections.append):
+                n = len(quoted_sections)
+                _append(match.group(1))
+                return _QUOTED_PLACEHOLDERS[n] if n < len(_QUOTED_PLACEHOLDERS) else f"__QUOTED_{n}__"
+
+            text = _RE_QUOTED_TEXT.sub(save_quoted, text)
+
+        # --- 0.1) Escape sequences for literal words ---
+        text = _RE_LITERAL_ESCAPE.sub(_literal_escape_repl, text)
+
+        # --- 0.2) Protect command words used as English nouns ("period of time",
+        #          "in return", "a dash of salt", "comma operator", etc.) ---
+        for pat, repl in _CONTEXT_PROTECT_PATTERNS:
+            text = pat.sub(repl, text)
+
+        # --- 1-2) Multi-word, then single-word replacements (order matters) ---
+        text = _fused_sub(_COMMAND_WORD_FUSED, text)
+
+    # --- 3-9) Bracket/quote spacing, punctuation cleanup, spacing ---
+    for gate, phase in _TIDY_PHASES:
+        if gate is not None and gate.search(text) is None:
+            continue
+        for pat, repl in phase:
+            text = pat.sub(repl, text)
+
+    # Per line: strip leading stray punctuation (keep ellipsis and
+    # quotes/parens), drop spaces after the indent tabs, collapse runs of
+    # spaces, strip trailing whitespace
+    text = _RE_LEADING_PUNCT.sub("", text)
+    text = _RE_TABS_THEN_SPACES.sub(r"\1", text)
+    text = _RE_MULTI_SPACE.sub(" ", text)
+    text = _RE_TRAILING_LINE_WS.sub("", text)
 
     # Capitalize standalone lowercase "i" (and "i'll", "i'm", "i've", "i'd")
-    # to "I". Done before the per-line capitalization pass so cap_first sees
+    # to "I". Done before the capitalization pass so it sees
     # an already-correct string and doesn't have to special-case the pronoun.
     text = _RE_STANDALONE_I.sub("I", text)
 
     # --- 10) Capitalization ---
-    def cap_first(s: str) -> str:
-        for i, ch in enumerate(s):
-            if ch.isalpha():
-                return s[:i] + ch.upper() + s[i+1:]
-        return s
-
-    # Temporarily convert §SHIFT_ENTER§ to newlines for capitalization processing
-    temp_text = text.replace("§SHIFT_ENTER§", "\n")
-
-    lines = []
-    for line in temp_text.split("\n"):
-        line = cap_first(line)
-        # Convert trailing comma to period at end of line
-        line = _RE_TRAILING_COMMA.sub(".", line)
-        # Add period at end of line if no punctuation exists
-        if line and line.strip() and not _RE_NO_END_PUNCT.search(line.rstrip()):
-            line = line.rstrip() + "."
-        # Capitalize after sentence enders
-        line = _RE_CAP_AFTER_ENDER.sub(lambda m: m.group(1) + m.group(2).upper(), line)
-        lines.append(line)
-    temp_text = "\n".join(lines)
-
-    # Convert newlines back to §SHIFT_ENTER§ markers
-    text = temp_text.replace("\n", "§SHIFT_ENTER§")
+    # Temporarily convert line-break markers to newlines for capitalization processing
+    temp_text = text.replace(_SHIFT_ENTER, "\n")
 
-    # --- 11) Place sentence punctuation inside closing smart quote ---
-    text = _RE_PUNCT_OUTSIDE_QUOTE.sub(r"\2" + "\u201d", text)
+    temp_text = _RE_LINE_FIRST_LETTER.sub(_cap_line_start, temp_text)
+    # Convert trailing comma to period at end of line
+    temp_text = _RE_TRAILING_COMMA.sub(".", temp_text)
+    # Add period at end of line if no punctuation exists
+    temp_text = _RE_NO_END_PUNCT.sub(r"\1.", temp_text)
+    # Capitalize after sentence enders
+    temp_text = _RE_CAP_AFTER_ENDER.sub(_cap_after_ender, temp_text)
 
-    # --- 12) Restore literal tokens ---
-    for placeholder, word in LITERAL_RESTORE.items():
-        text = text.replace(placeholder, word)
+    # Convert newlines back to line-break markers
+    text = temp_text.replace("\n", _SHIFT_ENTER)
 
-    # --- 12.5) Re-capitalize line starts after literal restore ---
-    # cap_first() ran while protected words were placeholders like
-    # "__LIT_RETURN__" (whose first letter is already uppercase), so a line
-    # STARTING with a protected word came back lowercase ("return to sender
-    # was..."). Idempotent: lines already capitalized are left untouched.
-    temp_text = text.replace("§SHIFT_ENTER§", "\n")
-    temp_text = "\n".join(cap_first(line) for line in temp_text.split("\n"))
-    text = temp_text.replace("\n", "§SHIFT_ENTER§")
-
-    # --- 13) Restore quoted sections with actual quote marks ---
-    for i, quoted_text in enumerate(quoted_sections):
-        text = text.replace(f"__QUOTED_{i}__", f'"{quoted_text}"')
+    # --- 11) Place sentence punctuation inside closing smart quote ---
+    if "\u201d" in text:
+        text = _RE_PUNCT_OUTSIDE_QUOTE.sub(r"\2" + "\u201d", text)
+
+    if has_commands:
+        # --- 12) Restore literal tokens ---
+        text = _RE_LITERAL_PLACEHOLDER.sub(lambda m: LITERAL_RESTORE[m.group(0)], text)
+
+        # --- 12.5) Re-capitalize line starts after literal restore ---
+        # Step 10 ran while protected words were placeholders like
+        # "__LIT_RETURN__" (whose first letter is already uppercase), so a line
+        # STARTING with a protected word came back lowercase ("return to sender
+        # was..."). Idempotent: lines already capitalized are left untouched.
+        temp_text = text.replace(_SHIFT_ENTER, "\n")
+        temp_text = _RE_LINE_FIRST_LETTER.sub(_cap_line_start, temp_text)
+        text = temp_text.replace("\n", _SHIFT_ENTER)
+
+        # --- 13) Restore quoted sections with actual quote marks ---
+        if quoted_sections:
+            text = _RE_QUOTED_PLACEHOLDER.sub(
+                lambda m: f'"{quoted_sections[int(m.group(1))]}"', text)
 
     # --- 14) Fix email/URL formatting ---
-    text = _RE_EMAIL_AT_WORD.sub(r"\1@\2.\3", text)
-    for pat, repl in _EMAIL_TLD_FIXES:
-        text = pat.sub(repl, text)
+    if _RE_SPOKEN_AT.search(text):
+        text = _RE_EMAIL_AT_WORD.sub(r"\1@\2.\3", text)
+    text = _RE_EMAIL_SPACING.sub(_fix_email_spacing, text)
 
     # --- 15) Fix time formatting ---
     # "11. 30 p. m." → "11:30 PM", "3:15 a. m." → "3:15 AM", etc.
     text = _RE_TIME_FORMAT.sub(_fix_time_ampm, text)
 
-    return text
+    return text.replace(_SHIFT_ENTER, SHIFT_ENTER_MARKER)
+
+
+# Spoken commands said on their own, mapped to the pipeline's own output
+# for them (computed once at import, so the two can never disagree). No
+# result keeps a letter of the spoken word and the command patterns ignore
+# case, so the lookup key can be lowercased; surrounding spaces are dropped
+# by the pipeline anyway.
+_SHORT_COMMAND_PHRASES = (
+    "new line", "newline", "return", "line break",
+    "new paragraph", "paragraph break",
+    "period", "full stop", "comma", "semicolon", "colon",
+    "question mark", "exclamation point", "exclamation mark",
+    "ellipsis", "dot dot dot", "apostrophe", "quote",
+    "open quote", "close quote", "open parenthesis", "close parenthesis",
+    "open bracket", "close bracket", "open brace", "close brace",
+    "em dash", "dash", "hyphen",
+)
+_SHORT_COMMANDS = {phrase: _normalize_pipeline(phrase) for phrase in _SHORT_COMMAND_PHRASES}
@@ -3,9 +3,10 @@ gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
 from gi.repository import Gtk, Gdk, GLib
 import os
+import re
 import subprocess
 import sys
-import atexit
+import fcntl
 import dbus
 import dbus.mainloop.glib
 from dataclasses import asdict
@@ -65,6 +66,107 @@ except ImportError:
         with open(path, "r") as f:
             return toml.load(f)
 
+# save_config() value formatting by exact type (bool is an int subclass, so
+# isinstance() checks would have to be ordered); anything else, ints
+# included, is written with str()
+_TOML_FORMATTERS = {
+    bool: lambda v: "true" if v else "false",
+    str: lambda v: f'"{v}"',
+}
+
+# Manual language choices for the Language dropdown, as (code, label).
+# Auto-detect is NOT listed here — it is handled by the Language Mode
+# dropdown. This list is only shown when "Manual selection" is active.
+_LANGUAGES = (
+    ("en", "🇺🇸 English"),
+    ("es", "🇪🇸 Spanish"),
+    ("fr", "🇫🇷 French"),
+    ("de", "🇩🇪 German"),
+    ("it", "🇮🇹 Italian"),
+    ("pt", "🇵🇹 Portuguese"),
+    ("ru", "🇷🇺 Russian"),
+    ("ja", "🇯🇵 Japanese"),
+    ("ko", "🇰🇷 Korean"),
+    ("zh", "🇨🇳 Chinese"),
+    ("ar", "🇸🇦 Arabic"),
+    ("hi", "🇮🇳 Hindi"),
+    ("nl", "🇳🇱 Dutch"),
+    ("sv", "🇸🇪 Swedish"),
+    ("no", "🇳🇴 Norwegian"),
+    ("da", "🇩🇰 Danish"),
+    ("fi", "🇫🇮 Finnish"),
+    ("pl", "🇵🇱 Polish"),
+    ("tr", "🇹🇷 Turkish"),
+    ("he", "🇮🇱 Hebrew"),
+    ("th", "🇹🇭 Thai"),
+    ("vi", "🇻🇳 Vietnamese"),
+    ("uk", "🇺🇦 Ukrainian"),
+    ("cs", "🇨🇿 Czech"),
+    ("hu", "🇭🇺 Hungarian"),
+    ("ro", "🇷🇴 Romanian"),
+    ("bg", "🇧🇬 Bulgarian"),
+    ("hr", "🇭🇷 Croatian"),
+    ("sk", "🇸🇰 Slovak"),
+    ("sl", "🇸🇮 Slovenian"),
+    ("et", "🇪🇪 Estonian"),
+    ("lv", "🇱🇻 Latvian"),
+    ("lt", "🇱🇹 Lithuanian"),
+)
+
+# Hold/toggle hotkey choices
+_HOTKEYS = ("F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "F10", "F11", "F12")
+
+# Minimum seconds between VU meter updates from the recording callback
+# (~30 Hz); smaller blocks or higher sample rates would otherwise queue
+# an idle callback per audio block
+_LEVEL_UPDATE_INTERVAL = 1 / 30
+
+# Seconds of audio the test recording buffer holds before it has to grow
+_RECORD_BUFFER_SECONDS = 30
+
+# Percentage in `pactl get-source-volume` output such as
+# "Volume: mono: 43423 /  66% / -10.73 dB" (first channel wins)
+_PACTL_VOLUME_RE = re.compile(r"/\s*(\d+)%\s*/")
+
+def _text_combo_store(items):
+    """Build a model for Gtk.ComboBoxText from (id, label) pairs.
+
+    ComboBoxText reads its label from column 0 and its id from column 1.
+    Filling a store directly and setting it as the model skips the
+    per-row append() plumbing, and one store can back several combos.
+    """
+    store = Gtk.ListStore(str, str)
+    for item_id, label in items:
+        store.append((label, item_id))
+    return store
+
+def _tab_grid():
+    """Grid for a settings tab: 10px cell spacing, 20px margins.
+
+    Construct-time properties are applied in the single object creation
+    call instead of six separate setter calls.
+    """
+    return Gtk.Grid(column_spacing=10, row_spacing=10,
+                    margin_start=20, margin_end=20, margin_top=20, margin_bottom=20)
+
+# Parsed TOML per path, as (st_mtime_ns, st_size, data). The window reads
+# the config when it opens and again on every Apply/OK (merge-on-save);
+# an unchanged file is not parsed twice.
+_toml_cache = {}
+
+def _load_toml_cached(path):
+    """load_toml(), skipping the parse when the file is unchanged.
+
+    Returns a copy, so callers may modify the result freely.
+    """
+    st = os.stat(path)
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return dict(cached[2])
+    data = load_toml(path)
+    _toml_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return dict(data)
+
 # Type coercion for on-disk config values. Configs written by the old
 # hand-rolled parser era (or hand-edited) can hold '5' where an int is
 # expected — Gtk.Adjustment(value='5') then crashes the window at startup.
@@ -93,43 +195,45 @@ def _coerce_config_types(config: dict) -> dict:
 def _runtime_dir():
     return os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")
 
-_PREFS_PIDFILE = os.path.join(_runtime_dir(), "talktype-prefs.pid")
+_PREFS_PIDFILE_NAME = "talktype-prefs.pid"
 
-def _pid_running(pid: int) -> bool:
-    if pid <= 0: return False
-    proc = f"/proc/{pid}"
-    if not os.path.exists(proc): return False
-    try:
-        with open(os.path.join(proc, "cmdline"), "rb") as f:
-            cmd = f.read().decode(errors="ignore")
-        return ("dictate-prefs" in cmd) or ("talktype.prefs" in cmd)
-    except Exception:
-        return True
+# Held for the process lifetime once acquired; the kernel drops the
+# lock when the process exits, however it exits
+_prefs_lock_fd = None
 
 def _acquire_prefs_singleton():
+    """Exit if another preferences window is open (flock on the pidfile).
+
+    Same approach as the tray's singleton lock: checking a PID and then
+    writing our own raced when two windows were launched at once.
+    """
+    global _prefs_lock_fd
+    # Resolved here rather than at import: importing prefs (tests, the
+    # tray's helpers) then costs no environment/getuid lookups, and the
+    # path follows XDG_RUNTIME_DIR as it is when the window starts
+    pidfile = os.path.join(_runtime_dir(), _PREFS_PIDFILE_NAME)
     try:
-        if os.path.exists(_PREFS_PIDFILE):
-            try:
-                with open(_PREFS_PIDFILE, "r") as f:
-                    old = int(f.read().strip() or "0")
-            except Exception:
-                old = 0
-            if _pid_running(old):
-                print("Another preferences window is already open. Exiting.")
-                sys.exit(0)
-        with open(_PREFS_PIDFILE, "w") as f:
-            f.write(str(os.getpid()))
-    except Exception as e:
+        fd = os.open(pidfile, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError as e:
         print(f"Warning: could not write prefs pidfile: {e}")
-    def _cleanup():
-        try:
-            with open(_PREFS_PIDFILE, "r") as f:
-                cur = int(f.read().strip() or "0")
-            if cur == os.getpid():
-                os.remove(_PREFS_PIDFILE)
-        except Exception:
-            pass
-    atexit.register(_cleanup)
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        print("Another preferences window is already open. Exiting.")
+        sys.exit(0)
+    except OSError as e:
+        os.close(fd)
+        print(f"Warning: could not lock prefs pidfile: {e}")
+        return
+    try:
+        # PID for information only; the lock is what counts
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+    except OSError:
+        pass
+    _prefs_lock_fd = fd
 
 
 class SegmentedVUMeter(Gtk.DrawingArea):
@@ -269,9 +373,9 @@ class PreferencesWindow:
         self.window.present()  # Bring window to front
         # Note: Don't use set_keep_above - it interferes with combo box popups
 
-        # Initialize UI state after window is shown
-        GLib.timeout_add(200, self._update_hotkey_ui_state)
-        GLib.timeout_add(200, self._update_language_ui_state)
+        # show_all() made every row visible; hide the manual language row
+        # now if auto-detect is on (no timer: the row would flash briefly)
+        self._update_language_ui_state()
         # Don't auto-start level monitoring - only when user clicks record button
 
     def _load_css(self):
@@ -318,7 +422,7 @@ class PreferencesWindow:
 
         if os.path.exists(CONFIG_PATH):
             try:
-                config = load_toml(CONFIG_PATH)
+                config = _load_toml_cached(CONFIG_PATH)
                 defaults.update(config)
             except Exception as e:
                 print(f"Error loading config: {e}")
@@ -346,8 +450,13 @@ class PreferencesWindow:
                 print(f"❌ CUDA availability check failed: {e}")
                 return False
     
-    def _refresh_device_options(self):
-        """Refresh the device dropdown options based on current CUDA availability."""
+    def _refresh_device_options(self, cuda_available=None):
+        """Refresh the device dropdown options based on current CUDA availability.
+
+        Args:
+            cuda_available: Result of an earlier _check_cuda_availability();
+                None runs the check now.
+        """
         if not hasattr(self, 'device_combo'):
             return
             
@@ -356,7 +465,8 @@ class PreferencesWindow:
         self.device_combo.append("cpu", "CPU")
         
         # Check CUDA availability and add option if available
-        cuda_available = self._check_cuda_availability()
+        if cuda_available is None:
+            cuda_available = self._check_cuda_availability()
         if cuda_available:
             self.device_combo.append("cuda", "CUDA (GPU)")
             tooltip_text = "Processing device for AI transcription:\n• CPU: works on all computers, slower\n• CUDA (GPU): much faster, requires NVIDIA graphics card"
@@ -367,9 +477,33 @@ class PreferencesWindow:
                 self.config["device"] = "cpu"
         
         # Set active selection and tooltip
-        self.device_combo.set_active_id(self.config["device"])
+        self._select_device(self.config["device"])
         self.device_combo.set_tooltip_text(tooltip_text)
+
+    def _select_device(self, device_id):
+        """Select *device_id* in the device dropdown without running its
+        "changed" handler: the caller has already settled the config value,
+        and re-selecting "cuda" would make update_config() repeat its
+        blocking CUDA check (and could pop its error dialog)."""
+        handler_id = getattr(self, "_device_changed_id", None)
+        if handler_id is None:  # still being built; handler not connected yet
+            self.device_combo.set_active_id(device_id)
+            return
+        self.device_combo.handler_block(handler_id)
+        try:
+            self.device_combo.set_active_id(device_id)
+        finally:
+            self.device_combo.handler_unblock(handler_id)
     
+    def _probe_cuda_async(self):
+        """Worker thread: check CUDA, then rebuild the device dropdown on the GTK thread."""
+        cuda_available = self._check_cuda_availability()
+        GLib.idle_add(self._apply_cuda_result, cuda_available)
+
+    def _apply_cuda_result(self, cuda_available):
+        self._refresh_device_options(cuda_available)
+        return False
+
     def save_config(self):
         """Save config to TOML file (merge-on-save).
 
@@ -395,7 +529,7 @@ class PreferencesWindow:
             on_disk = {}
             if os.path.exists(CONFIG_PATH):
                 try:
-                    on_disk = load_toml(CONFIG_PATH)
+                    on_disk = _load_toml_cached(CONFIG_PATH)
                 except Exception as e:
                     print(f"Error re-reading config for merge: {e}")
             # Base: window-open snapshot (has every key incl. defaults),
@@ -405,17 +539,30 @@ class PreferencesWindow:
             merged = merge_changed_keys(self._config_at_open, self.config, base)
 
             os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                f.write("# TalkType config\n")
-                for key, value in merged.items():
-                    if isinstance(value, bool):
-                        f.write(f'{key} = {str(value).lower()}\n')
-                    elif isinstance(value, str):
-                        f.write(f'{key} = "{value}"\n')
-                    else:
-                        f.write(f'{key} = {value}\n')
-                f.flush()  # Ensure file is written to disk
-                os.fsync(f.fileno())  # Force write to disk
+            lines = ["# TalkType config\n"]
+            lines.extend(f"{key} = {_TOML_FORMATTERS.get(type(value), str)(value)}\n"
+                         for key, value in merged.items())
+            # Write a temp file and rename it over the config: a crash or a
+            # full disk mid-save leaves the old file instead of a truncated
+            # one. realpath() keeps a symlinked (dotfiles) config a symlink.
+            target = os.path.realpath(CONFIG_PATH)
+            tmp_path = target + ".tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write("".join(lines).encode("utf-8"))
+                    f.flush()  # Ensure file is written to disk
+                    os.fsync(f.fileno())  # Force write to disk
+                os.replace(tmp_path, target)
+            except Exception:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # Re-parse on the next read rather than trusting `merged`: values
+            # are written unescaped, so the file may not read back the same
+            _toml_cache.pop(CONFIG_PATH, None)
 
             # Future saves in this window diff against what we just wrote
             self.config = dict(merged)
@@ -524,13 +671,7 @@ class PreferencesWindow:
         self.window.add(main_vbox)
     
     def create_general_tab(self):
-        grid = Gtk.Grid()
-        grid.set_column_spacing(10)
-        grid.set_row_spacing(10)
-        grid.set_margin_start(20)
-        grid.set_margin_end(20)
-        grid.set_margin_top(20)
-        grid.set_margin_bottom(20)
+        grid = _tab_grid()
 
         row = 0
 
@@ -632,10 +773,15 @@ class PreferencesWindow:
         # Store device combo for later refresh
         self.device_combo = device_combo
         
-        # Populate device options
-        self._refresh_device_options()
+        # Populate device options. Trust the saved device until CUDA has
+        # been checked: the check runs subprocesses (or, without
+        # cuda_helper, loads a model on the GPU), so it runs in a worker
+        # thread and the dropdown is rebuilt when it answers.
+        self._refresh_device_options(cuda_available=self.config["device"] == "cuda")
+        import threading
+        threading.Thread(target=self._probe_cuda_async, daemon=True).start()
         
-        device_combo.connect("changed", lambda x: self.update_config("device", x.get_active_id()))
+        self._device_changed_id = device_combo.connect("changed", self._on_combo_changed, "device")
         grid.attach(device_combo, 1, row, 1, 1)
         row += 1
         
@@ -650,7 +796,7 @@ class PreferencesWindow:
         self.lang_mode_combo.append("auto", "Auto-detect")
         self.lang_mode_combo.append("manual", "Manual Selection (Faster)")
         self.lang_mode_combo.set_active_id(self.config.get("language_mode", "auto"))
-        self.lang_mode_combo.connect("changed", lambda x: self.update_config("language_mode", x.get_active_id()))
+        self.lang_mode_combo.connect("changed", self._on_combo_changed, "language_mode")
         self.lang_mode_combo.connect("changed", self._on_language_mode_changed)
         grid.attach(self.lang_mode_combo, 1, row, 1, 1)
         row += 1
@@ -664,48 +810,9 @@ class PreferencesWindow:
         self.lang_combo.connect("button-press-event", self._on_combo_button_press)
         self._block_combo_scroll(self.lang_combo)
 
-        # Add language options with flags
-        # Note: Auto-detect is NOT listed here — it is handled by the Language Mode
-        # dropdown above. This list is only shown when "Manual selection" is active.
-        languages = [
-            ("en", "🇺🇸 English"),
-            ("es", "🇪🇸 Spanish"),
-            ("fr", "🇫🇷 French"),
-            ("de", "🇩🇪 German"),
-            ("it", "🇮🇹 Italian"),
-            ("pt", "🇵🇹 Portuguese"),
-            ("ru", "🇷🇺 Russian"),
-            ("ja", "🇯🇵 Japanese"),
-            ("ko", "🇰🇷 Korean"),
-            ("zh", "🇨🇳 Chinese"),
-            ("ar", "🇸🇦 Arabic"),
-            ("hi", "🇮🇳 Hindi"),
-            ("nl", "🇳🇱 Dutch"),
-            ("sv", "🇸🇪 Swedish"),
-            ("no", "🇳🇴 Norwegian"),
-            ("da", "🇩🇰 Danish"),
-            ("fi", "🇫🇮 Finnish"),
-            ("pl", "🇵🇱 Polish"),
-            ("tr", "🇹🇷 Turkish"),
-            ("he", "🇮🇱 Hebrew"),
-            ("th", "🇹🇭 Thai"),
-            ("vi", "🇻🇳 Vietnamese"),
-            ("uk", "🇺🇦 Ukrainian"),
-            ("cs", "🇨🇿 Czech"),
-            ("hu", "🇭🇺 Hungarian"),
-            ("ro", "🇷🇴 Romanian"),
-            ("bg", "🇧🇬 Bulgarian"),
-            ("hr", "🇭🇷 Croatian"),
-            ("sk", "🇸🇰 Slovak"),
-            ("sl", "🇸🇮 Slovenian"),
-            ("et", "🇪🇪 Estonian"),
-            ("lv", "🇱🇻 Latvian"),
-            ("lt", "🇱🇹 Lithuanian")
-        ]
-        
-        for code, name in languages:
-            self.lang_combo.append(code, name)
-        
+        # Language options with flags (see _LANGUAGES)
+        self.lang_combo.set_model(_text_combo_store(_LANGUAGES))
+
         # Set current selection — default to English if unset or previously set
         # to auto-detect (empty string, which no longer exists in this list)
         current_lang = self.config.get("language", "") or "en"
@@ -713,7 +820,7 @@ class PreferencesWindow:
         if self.lang_combo.get_active_id() is None:
             self.lang_combo.set_active_id("en")  # Safe fallback
 
-        self.lang_combo.connect("changed", lambda x: self.update_config("language", x.get_active_id()))
+        self.lang_combo.connect("changed", self._on_combo_changed, "language")
         # Tooltip moved to label to avoid interference with dropdown popup
         grid.attach(self.lang_combo, 1, row, 1, 1)
         row += 1
@@ -744,20 +851,19 @@ class PreferencesWindow:
         self.hotkey_combo.connect("button-press-event", self._on_combo_button_press)
         self._block_combo_scroll(self.hotkey_combo)
 
-        # Add F-key options (most practical for dictation)
-        hotkeys = ["F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "F10", "F11", "F12"]
-        
-        for key in hotkeys:
-            self.hotkey_combo.append(key, key)
+        # F-key options (most practical for dictation); the toggle combo
+        # below shows the same rows, so both share one model
+        hotkey_store = _text_combo_store((key, key) for key in _HOTKEYS)
+        self.hotkey_combo.set_model(hotkey_store)
         
         # Set current selection or default to F8
         current_hotkey = self.config.get("hotkey", "F8")
-        if current_hotkey in hotkeys:
+        if current_hotkey in _HOTKEYS:
             self.hotkey_combo.set_active_id(current_hotkey)
         else:
             self.hotkey_combo.set_active_id("F8")  # Default fallback
 
-        self.hotkey_combo.connect("changed", lambda x: self.update_config("hotkey", x.get_active_id()))
+        self.hotkey_combo.connect("changed", self._on_combo_changed, "hotkey")
         # Tooltip moved to label to avoid interference with dropdown popup
         grid.attach(self.hotkey_combo, 1, row, 1, 1)
         row += 1
@@ -770,18 +876,17 @@ class PreferencesWindow:
         self.toggle_combo.connect("button-press-event", self._on_combo_button_press)
         self._block_combo_scroll(self.toggle_combo)
 
-        # Add same options for toggle key
-        for key in hotkeys:
-            self.toggle_combo.append(key, key)
+        # Same options for toggle key
+        self.toggle_combo.set_model(hotkey_store)
             
         # Set current selection or default to F9
         current_toggle = self.config.get("toggle_hotkey", "F9")
-        if current_toggle in hotkeys:
+        if current_toggle in _HOTKEYS:
             self.toggle_combo.set_active_id(current_toggle)
         else:
             self.toggle_combo.set_active_id("F9")  # Default fallback
 
-        self.toggle_combo.connect("changed", lambda x: self.update_config("toggle_hotkey", x.get_active_id()))
+        self.toggle_combo.connect("changed", self._on_combo_changed, "toggle_hotkey")
         # Tooltip moved to label to avoid interference with dropdown popup
 
         # Attach toggle elements to grid
@@ -859,7 +964,7 @@ class PreferencesWindow:
         # Launch at login checkbox
         self.launch_at_login_check = Gtk.CheckButton(label="Launch TalkType at login")
         self.launch_at_login_check.set_active(self.config.get("launch_at_login", False))
-        self.launch_at_login_check.connect("toggled", lambda x: self.update_config("launch_at_login", x.get_active()))
+        self.launch_at_login_check.connect("toggled", self._on_check_toggled, "launch_at_login")
         self.launch_at_login_check.set_tooltip_text("Automatically start TalkType when you log in to your desktop.\nUseful for having dictation always available.")
         grid.attach(self.launch_at_login_check, 0, row, 2, 1)
         row += 1
@@ -867,13 +972,8 @@ class PreferencesWindow:
         return grid
     
     def create_audio_tab(self):
-        grid = Gtk.Grid()
-        grid.set_column_spacing(10)
-        grid.set_row_spacing(10)
-        grid.set_margin_start(20)
-        grid.set_margin_end(20)
-        grid.set_margin_top(20)
-        grid.set_margin_bottom(20)
+        import threading
+        grid = _tab_grid()
 
         row = 0
 
@@ -892,38 +992,13 @@ class PreferencesWindow:
         mic_combo.connect("button-press-event", self._on_combo_button_press)
         self._block_combo_scroll(mic_combo)
 
-        # Get available input devices
-        try:
-            import sounddevice as sd
-            devices = sd.query_devices()
-            input_devices = [(i, d) for i, d in enumerate(devices) if d.get("max_input_channels", 0) > 0]
-            
-            # Add default option
-            mic_combo.append("", "System Default")
-            
-            # Add all input devices
-            for device_idx, device_info in input_devices:
-                device_name = device_info.get("name", f"Device {device_idx}")
-                # Use device name as ID for matching
-                mic_combo.append(device_name, f"{device_name}")
-                
-        except Exception as e:
-            # Fallback if sounddevice fails
-            mic_combo.append("", "System Default")
-            print(f"Could not list audio devices: {e}")
-        
-        # Set current selection
-        current_mic = self.config["mic"]
-        if not current_mic:
-            mic_combo.set_active_id("")  # Default
-        else:
-            # Try to find matching device
-            mic_combo.set_active_id(current_mic)
-            if mic_combo.get_active_id() is None:
-                # If exact match not found, set to default
-                mic_combo.set_active_id("")
-        
-        mic_combo.connect("changed", lambda x: self.update_config("mic", x.get_active_id()))
+        # Only "System Default" for now: listing devices initializes
+        # PortAudio, which would hold up the window's first paint. The
+        # devices are filled in from a worker thread (_populate_mics).
+        mic_combo.append("", "System Default")
+        mic_combo.set_active_id("")
+        self._mic_changed_id = mic_combo.connect("changed", self._on_combo_changed, "mic")
+        threading.Thread(target=self._enumerate_mics, args=(mic_combo,), daemon=True).start()
         grid.attach(mic_combo, 1, row, 1, 1)
         row += 1
         
@@ -938,10 +1013,14 @@ class PreferencesWindow:
         volume_label = Gtk.Label(label="Input Volume:")
         self.volume_scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL)
         self.volume_scale.set_range(0, 100)
-        self.volume_scale.set_value(self.get_system_mic_volume())  # Get current system volume
         self.volume_scale.set_hexpand(True)
         self.volume_scale.set_tooltip_text("Adjust system microphone input volume (PipeWire/PulseAudio)")
-        self.volume_scale.connect("value-changed", self.on_volume_changed)
+        self._volume_changed_id = self.volume_scale.connect("value-changed", self.on_volume_changed)
+        # Reading the current volume runs wpctl/pactl (up to 2s timeouts
+        # each), so it happens in a worker; the slider stays disabled until
+        # it shows the real value
+        self.volume_scale.set_sensitive(False)
+        threading.Thread(target=self._load_mic_volume_async, daemon=True).start()
         volume_box.pack_start(volume_label, False, False, 0)
         volume_box.pack_start(self.volume_scale, True, True, 0)
         mic_test_box.pack_start(volume_box, False, False, 0)
@@ -998,6 +1077,8 @@ class PreferencesWindow:
         # Initialize microphone test state
         self.recording = False
         self.recorded_audio = None
+        self._record_pos = 0
+        self._device_idx_cache = None  # (mic setting, device index)
 
         # ===== AUDIO FEEDBACK SECTION =====
         separator1 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
@@ -1016,7 +1097,7 @@ class PreferencesWindow:
         # Beeps
         beeps_check = Gtk.CheckButton(label="Play beeps for start/stop/ready")
         beeps_check.set_active(self.config["beeps"])
-        beeps_check.connect("toggled", lambda x: self.update_config("beeps", x.get_active()))
+        beeps_check.connect("toggled", self._on_check_toggled, "beeps")
         beeps_check.set_tooltip_text("Play audio beeps to confirm when recording starts, stops, and when transcription is ready.\nHelps you know the system is responding.")
         grid.attach(beeps_check, 0, row, 2, 1)
         row += 1
@@ -1024,7 +1105,7 @@ class PreferencesWindow:
         # Notifications
         notify_check = Gtk.CheckButton(label="Show desktop notifications")
         notify_check.set_active(self.config["notify"])
-        notify_check.connect("toggled", lambda x: self.update_config("notify", x.get_active()))
+        notify_check.connect("toggled", self._on_check_toggled, "notify")
         notify_check.set_tooltip_text("Show desktop notifications with transcribed text preview.\nUseful to confirm what was transcribed without switching windows.")
         grid.attach(notify_check, 0, row, 2, 1)
         row += 1
@@ -1032,7 +1113,7 @@ class PreferencesWindow:
         # Recording indicator
         indicator_check = Gtk.CheckButton(label="Show visual recording indicator")
         indicator_check.set_active(self.config.get("recording_indicator", True))
-        indicator_check.connect("toggled", lambda x: self.update_config("recording_indicator", x.get_active()))
+        indicator_check.connect("toggled", self._on_check_toggled, "recording_indicator")
         indicator_check.set_tooltip_text("Show an animated visual indicator while recording.\nHelps you see that dictation is active and responding to your voice.")
         grid.attach(indicator_check, 0, row, 2, 1)
         row += 1
@@ -1051,7 +1132,7 @@ class PreferencesWindow:
 
         current_size = self.config.get("indicator_size", "medium")
         size_combo.set_active_id(current_size)
-        size_combo.connect("changed", lambda x: self.update_config("indicator_size", x.get_active_id()))
+        size_combo.connect("changed", self._on_combo_changed, "indicator_size")
         # Tooltip moved to label to avoid interference with dropdown popup
         grid.attach(size_combo, 1, row, 1, 1)
         row += 1
@@ -1093,7 +1174,7 @@ class PreferencesWindow:
 
         current_position = self.config.get("indicator_position", "center")
         position_combo.set_active_id(current_position)
-        position_combo.connect("changed", lambda x: self.update_config("indicator_position", x.get_active_id()))
+        position_combo.connect("changed", self._on_combo_changed, "indicator_position")
 
         # Enable positioning if: X11 session OR (Wayland + GNOME extension installed)
         if is_wayland and not has_extension:
@@ -1125,7 +1206,7 @@ class PreferencesWindow:
         offset_x_adj = Gtk.Adjustment(value=self.config.get("indicator_offset_x", 0), lower=-1000, upper=1000, step_increment=10)
         offset_x_spin = Gtk.SpinButton(adjustment=offset_x_adj)
         offset_x_spin.set_value(self.config.get("indicator_offset_x", 0))
-        offset_x_spin.connect("value-changed", lambda x: self.update_config("indicator_offset_x", int(x.get_value())))
+        offset_x_spin.connect("value-changed", self._on_spin_changed, "indicator_offset_x")
         offset_x_spin.connect("scroll-event", lambda *a: True)  # Disable scroll wheel to prevent accidental changes
         offset_x_spin.set_tooltip_text("Fine-tune horizontal position.\nPositive = right, Negative = left")
         if is_wayland and not has_extension:
@@ -1140,7 +1221,7 @@ class PreferencesWindow:
         offset_y_adj = Gtk.Adjustment(value=self.config.get("indicator_offset_y", 0), lower=-1000, upper=1000, step_increment=10)
         offset_y_spin = Gtk.SpinButton(adjustment=offset_y_adj)
         offset_y_spin.set_value(self.config.get("indicator_offset_y", 0))
-        offset_y_spin.connect("value-changed", lambda x: self.update_config("indicator_offset_y", int(x.get_value())))
+        offset_y_spin.connect("value-changed", self._on_spin_changed, "indicator_offset_y")
         offset_y_spin.connect("scroll-event", lambda *a: True)  # Disable scroll wheel to prevent accidental changes
         offset_y_spin.set_tooltip_text("Fine-tune vertical position.\nPositive = down, Negative = up")
         if is_wayland and not has_extension:
@@ -1151,13 +1232,7 @@ class PreferencesWindow:
         return grid
     
     def create_advanced_tab(self):
-        grid = Gtk.Grid()
-        grid.set_column_spacing(10)
-        grid.set_row_spacing(10)
-        grid.set_margin_start(20)
-        grid.set_margin_end(20)
-        grid.set_margin_top(20)
-        grid.set_margin_bottom(20)
+        grid = _tab_grid()
 
         row = 0
 
@@ -1172,7 +1247,7 @@ class PreferencesWindow:
         # Smart quotes
         quotes_check = Gtk.CheckButton(label="Use smart quotes (" ")")
         quotes_check.set_active(self.config["smart_quotes"])
-        quotes_check.connect("toggled", lambda x: self.update_config("smart_quotes", x.get_active()))
+        quotes_check.connect("toggled", self._on_check_toggled, "smart_quotes")
         quotes_check.set_tooltip_text("Convert spoken quotes to curved 'smart quotes' instead of straight \"quotes\".\nSay 'open quote' and 'close quote' when dictating.")
         grid.attach(quotes_check, 0, row, 2, 1)
         row += 1
@@ -1180,7 +1255,7 @@ class PreferencesWindow:
         # Auto space
         space_check = Gtk.CheckButton(label="Auto-space between utterances")
         space_check.set_active(self.config["auto_space"])
-        space_check.connect("toggled", lambda x: self.update_config("auto_space", x.get_active()))
+        space_check.connect("toggled", self._on_check_toggled, "auto_space")
         space_check.set_tooltip_text("Automatically add a space before each new dictation.\nTurn off if you want to control spacing manually.")
         grid.attach(space_check, 0, row, 2, 1)
         row += 1
@@ -1188,7 +1263,7 @@ class PreferencesWindow:
         # Auto period
         period_check = Gtk.CheckButton(label="Ensure period at end of sentences")
         period_check.set_active(bool(self.config.get("auto_period", True)))  # Ensure boolean, default True
-        period_check.connect("toggled", lambda x: self.update_config("auto_period", x.get_active()))
+        period_check.connect("toggled", self._on_check_toggled, "auto_period")
         period_check.set_tooltip_text("Ensure every sentence ends with punctuation.\n\nWhisper AI usually adds periods automatically, but sometimes misses them.\nThis option adds a period when Whisper forgets, ensuring consistent punctuation.\n\nUnchecked: You get whatever Whisper outputs (sometimes has periods, sometimes doesn't)\nChecked: Every sentence is guaranteed to end with punctuation")
         grid.attach(period_check, 0, row, 2, 1)
         row += 1
@@ -1206,7 +1281,7 @@ class PreferencesWindow:
         inject_combo.append("type", "Keystroke Typing")
         inject_combo.append("paste", "Clipboard Paste")
         inject_combo.set_active_id(self.config["injection_mode"])
-        inject_combo.connect("changed", lambda x: self.update_config("injection_mode", x.get_active_id()))
+        inject_combo.connect("changed", self._on_combo_changed, "injection_mode")
         # Tooltip moved to label to avoid interference with dropdown popup
         grid.attach(inject_combo, 1, row, 1, 1)
         row += 1
@@ -1228,7 +1303,7 @@ class PreferencesWindow:
         # Auto timeout checkbox
         self.auto_timeout_check = Gtk.CheckButton(label="Enable auto-timeout after inactivity")
         self.auto_timeout_check.set_active(self.config.get("auto_timeout_enabled", False))
-        self.auto_timeout_check.connect("toggled", lambda x: self.update_config("auto_timeout_enabled", x.get_active()))
+        self.auto_timeout_check.connect("toggled", self._on_check_toggled, "auto_timeout_enabled")
         self.auto_timeout_check.connect("toggled", self._on_auto_timeout_toggled)
         self.auto_timeout_check.set_tooltip_text("Automatically stop the dictation service after a period of inactivity.\nThis helps save battery life on laptops and reduces CPU usage.")
         grid.attach(self.auto_timeout_check, 0, row, 2, 1)
@@ -1242,7 +1317,7 @@ class PreferencesWindow:
         self.timeout_spin.set_range(1, 60)  # 1 to 60 minutes
         self.timeout_spin.set_increments(1, 5)
         self.timeout_spin.set_value(self.config.get("auto_timeout_minutes", 5))
-        self.timeout_spin.connect("value-changed", lambda x: self.update_config("auto_timeout_minutes", int(x.get_value())))
+        self.timeout_spin.connect("value-changed", self._on_spin_changed, "auto_timeout_minutes")
         self.timeout_spin.connect("scroll-event", lambda *a: True)  # Disable scroll wheel to prevent accidental changes
         self.timeout_spin.set_tooltip_text("Number of minutes of inactivity before automatically stopping dictation.\n• 1-5 minutes: Very aggressive (good for short sessions)\n• 5-15 minutes: Balanced (recommended for laptop use)\n• 15-30 minutes: Conservative (good for desktop use)")
         grid.attach(self.timeout_spin, 1, row, 1, 1)
@@ -1605,7 +1680,7 @@ class PreferencesWindow:
 
         auto_check_toggle = Gtk.CheckButton(label="Automatically check for updates on startup")
         auto_check_toggle.set_active(self.config.get("auto_check_updates", True))
-        auto_check_toggle.connect("toggled", lambda x: self.update_config("auto_check_updates", x.get_active()))
+        auto_check_toggle.connect("toggled", self._on_check_toggled, "auto_check_updates")
         auto_check_toggle.set_tooltip_text(
             "When enabled, TalkType will check for updates once per day when it starts.\n"
             "If an update is found, you'll be notified and the Updates tab will open."
@@ -2029,6 +2104,17 @@ class PreferencesWindow:
         # Let GTK handle the normal click event
         return False
 
+    # Shared signal handlers for widgets that map straight onto one config
+    # key (passed as the connect() user data)
+    def _on_combo_changed(self, combo, key):
+        self.update_config(key, combo.get_active_id())
+
+    def _on_check_toggled(self, check, key):
+        self.update_config(key, check.get_active())
+
+    def _on_spin_changed(self, spin, key):
+        self.update_config(key, int(spin.get_value()))
+
     def update_config(self, key, value):
         """Update config value."""
         # GTK combos emit 'changed' with get_active_id()=None while being
@@ -2216,7 +2302,7 @@ class PreferencesWindow:
         # the OLD device selection, so without this the dropdown shows CPU
         # while the config now says cuda.
         if hasattr(self, 'device_combo'):
-            self.device_combo.set_active_id("cuda")
+            self._select_device("cuda")
 
     def _handle_autostart(self, enable):
         """Create or remove autostart desktop file."""
@@ -2401,6 +2487,42 @@ Hidden=true
         except Exception:
             return 16000
 
+    def _enumerate_mics(self, mic_combo):
+        """Worker thread: list input devices, then hand them to the GTK thread."""
+        try:
+            import sounddevice as sd
+            devices = sd.query_devices()
+            input_devices = [(i, d) for i, d in enumerate(devices) if d.get("max_input_channels", 0) > 0]
+        except Exception as e:
+            print(f"Could not list audio devices: {e}")
+            input_devices = []
+        GLib.idle_add(self._populate_mics, mic_combo, input_devices)
+
+    def _populate_mics(self, mic_combo, input_devices):
+        """Add the listed input devices to the microphone combo and select the configured one."""
+        # Selecting the saved mic is not a user change; with the handler
+        # live, a mic that is no longer plugged in would be saved as ""
+        mic_combo.handler_block(self._mic_changed_id)
+        try:
+            for device_idx, device_info in input_devices:
+                device_name = device_info.get("name", f"Device {device_idx}")
+                # Use device name as ID for matching
+                mic_combo.append(device_name, f"{device_name}")
+
+            # Set current selection
+            current_mic = self.config["mic"]
+            if not current_mic:
+                mic_combo.set_active_id("")  # Default
+            else:
+                # Try to find matching device
+                mic_combo.set_active_id(current_mic)
+                if mic_combo.get_active_id() is None:
+                    # If exact match not found, set to default
+                    mic_combo.set_active_id("")
+        finally:
+            mic_combo.handler_unblock(self._mic_changed_id)
+        return False
+
     def get_selected_device_idx(self):
         """Get the device index for the currently selected microphone.
 
@@ -2410,24 +2532,25 @@ Hidden=true
         """
         from .config import find_input_device
         current_mic = self.config.get("mic", "")
-        return find_input_device(current_mic)
+        # Resolving the device enumerates PortAudio (and may run wpctl);
+        # reuse the result until the mic setting changes
+        if self._device_idx_cache is None or self._device_idx_cache[0] != current_mic:
+            self._device_idx_cache = (current_mic, find_input_device(current_mic))
+        return self._device_idx_cache[1]
     
     def update_level_bar(self, level):
         """Update the VU meter with current audio level."""
-        # The SegmentedVUMeter handles colors automatically based on level
-        self.level_bar.set_value(level)
-
-        # Track statistics for post-recording evaluation
-        if hasattr(self, '_level_samples'):
-            self._level_samples.append(level)
-            if level > self._peak_level:
-                self._peak_level = level
-
+        # A redraw queued just before Stop must not undo its reset to zero
+        if self.recording:
+            # The SegmentedVUMeter handles colors automatically based on level
+            self.level_bar.set_value(level)
         return False  # Don't repeat
     
     def on_start_recording(self, button):
         """Start recording microphone input."""
         try:
+            import math
+            import time as time_mod
             import sounddevice as sd
             import numpy as np
 
@@ -2437,11 +2560,18 @@ Hidden=true
 
             # Start recording
             self.recording = True
-            self.recorded_frames = []
+            # Blocks are written into one preallocated buffer (doubled when
+            # full) so stopping is a slice rather than a concatenate
+            self._record_buf = np.empty(
+                (self._recording_sr * _RECORD_BUFFER_SECONDS, 1), dtype=np.float32
+            )
+            self._record_pos = 0
 
             # Initialize level tracking for post-recording evaluation
             self._level_samples = []
             self._peak_level = 0.0
+            self._last_level_ts = 0.0
+            self._meter_level = 0.0
 
             # Clear any previous status message
             self.level_status.set_text("🎤 Recording... speak normally")
@@ -2452,10 +2582,35 @@ Hidden=true
 
             def audio_callback(indata, frames, time, status):
                 if self.recording:
-                    self.recorded_frames.append(indata.copy())
-                    # Update level bar
-                    rms = np.sqrt(np.mean(indata**2))
-                    GLib.idle_add(self.update_level_bar, min(rms * 10, 1.0))
+                    end = self._record_pos + len(indata)
+                    if end > len(self._record_buf):
+                        grown = np.empty(
+                            (max(end, 2 * len(self._record_buf)), 1), dtype=np.float32
+                        )
+                        grown[:self._record_pos] = self._record_buf[:self._record_pos]
+                        self._record_buf = grown
+                    self._record_buf[self._record_pos:end] = indata
+                    self._record_pos = end
+                    # Update level bar; a dot product of the flattened block
+                    # avoids allocating indata**2 on the audio thread
+                    flat = indata.reshape(-1)
+                    rms = math.sqrt(float(flat @ flat) / flat.size)
+                    level = min(rms * 10, 1.0)
+
+                    # Track every block's level for post-recording evaluation;
+                    # the grade thresholds are tuned for per-block levels
+                    self._level_samples.append(level)
+                    if level > self._peak_level:
+                        self._peak_level = level
+
+                    # Only the meter redraw is coalesced to the display rate,
+                    # showing the loudest block since the last redraw
+                    self._meter_level = max(self._meter_level, level)
+                    now = time_mod.monotonic()
+                    if now - self._last_level_ts >= _LEVEL_UPDATE_INTERVAL:
+                        self._last_level_ts = now
+                        GLib.idle_add(self.update_level_bar, self._meter_level)
+                        self._meter_level = 0.0
 
             self.record_stream = sd.InputStream(
                 callback=audio_callback,
@@ -2472,6 +2627,9 @@ Hidden=true
             self.replay_btn.set_sensitive(False)
 
         except Exception as e:
+            # The device may have been unplugged or renumbered; resolve it
+            # again on the next attempt
+            self._device_idx_cache = None
             self.show_error_dialog("Recording failed!", str(e))
     
     def on_stop_recording(self, button):
@@ -2483,15 +2641,15 @@ Hidden=true
                 self.record_stream.stop()
                 self.record_stream.close()
             
-            # Combine recorded frames
-            if self.recorded_frames:
-                import numpy as np
-                self.recorded_audio = np.concatenate(self.recorded_frames, axis=0)
+            # Keep the filled part of the buffer (stream.stop() has waited
+            # for the last callback)
+            if self._record_pos:
+                self.recorded_audio = self._record_buf[:self._record_pos]
             
             # Update button states
             self.start_record_btn.set_sensitive(True)
             self.stop_record_btn.set_sensitive(False)
-            self.replay_btn.set_sensitive(len(self.recorded_frames) > 0)
+            self.replay_btn.set_sensitive(self._record_pos > 0)
             
             # Reset level bar
             self.level_bar.set_value(0.0)
@@ -2579,11 +2737,11 @@ Hidden=true
                 import sounddevice as sd
                 import numpy as np
 
-                # Amplify the audio for better playback volume (3x boost)
-                amplified_audio = self.recorded_audio * 3.0
-
-                # Ensure we don't clip (values stay between -1 and 1)
-                amplified_audio = np.clip(amplified_audio, -1.0, 1.0)
+                # Amplify the audio for better playback volume (3x boost),
+                # then clip in place so values stay between -1 and 1; the
+                # recording itself is left untouched for the next replay
+                amplified_audio = np.multiply(self.recorded_audio, 3.0)
+                np.clip(amplified_audio, -1.0, 1.0, out=amplified_audio)
 
                 # Find a working output device (default may be a mic-only USB device)
                 out_device, out_sr = self._find_playback_device()
@@ -2655,19 +2813,9 @@ Hidden=true
                 capture_output=True, text=True, timeout=2
             )
             if result.returncode == 0:
-                # Parse volume from output like "Volume: mono: 43423 /  66% / -10.73 dB"
-                for line in result.stdout.split('\n'):
-                    if 'Volume:' in line and '%' in line:
-                        # Extract percentage - look for pattern "/ XX% /"
-                        if '/' in line and '%' in line:
-                            parts = line.split('/')
-                            for part in parts:
-                                part = part.strip()
-                                if part.endswith('%'):
-                                    try:
-                                        return int(part[:-1])
-                                    except ValueError:
-                                        continue
+                match = _PACTL_VOLUME_RE.search(result.stdout)
+                if match:
+                    return int(match.group(1))
         except FileNotFoundError:
             # pactl not installed either
             pass
@@ -2677,6 +2825,22 @@ Hidden=true
         # Fallback to 50% if neither wpctl nor pactl work
         return 50
     
+    def _load_mic_volume_async(self):
+        """Worker thread: read the system mic volume, then show it on the GTK thread."""
+        volume = self.get_system_mic_volume()
+        GLib.idle_add(self._apply_mic_volume, volume)
+
+    def _apply_mic_volume(self, volume):
+        # Showing the current volume is not a change: don't write it back
+        # to the mixer through on_volume_changed
+        self.volume_scale.handler_block(self._volume_changed_id)
+        try:
+            self.volume_scale.set_value(volume)
+        finally:
+            self.volume_scale.handler_unblock(self._volume_changed_id)
+        self.volume_scale.set_sensitive(True)
+        return False
+
     def set_system_mic_volume(self, volume_percent):
         """
         Set the system microphone volume.
@@ -2730,10 +2894,6 @@ Hidden=true
             self.lang_label.set_visible(True)
             self.lang_combo.set_visible(True)
     
-    def _update_hotkey_ui_state(self):
-        """Both hotkeys are always visible — nothing to show/hide."""
-        return False  # Don't repeat
-    
     def _update_language_ui_state(self):
         """Update language UI state based on current config."""
         language_mode = self.config.get("language_mode", "auto")
@@ -2763,27 +2923,56 @@ Hidden=true
         self._check_gpu_status()
         return False  # Don't repeat
 
-    def _check_gpu_status(self):
-        """Check GPU and CUDA status and update UI."""
+    def _check_gpu_status(self, refresh_gpu=False, on_done=None):
+        """Check GPU and CUDA status and update UI.
+
+        The probes run in a worker thread and the labels are updated on the
+        GTK thread (_apply_gpu_status), so a slow nvidia-smi never freezes
+        the window. on_done, if given, is called there afterwards.
+
+        The nvidia-smi probe (up to 5s) runs once per window: the GPU can't
+        change while it is open. The "Check for NVIDIA GPU" button passes
+        refresh_gpu=True to probe again. The CUDA library check is re-run
+        every time, since a download changes it.
+        """
+        # Import cuda_helper
         try:
-            # Import cuda_helper
+            from . import cuda_helper
+        except ImportError:
+            # If cuda_helper doesn't exist, create stub
+            self.gpu_status_label.set_text("GPU detection not available in this build")
+            self.cuda_status_label.set_text("")
+            self.check_gpu_button.set_sensitive(False)
+            self.download_cuda_button.set_sensitive(False)
+            if on_done:
+                on_done()
+            return
+
+        cached_gpu = None if refresh_gpu else getattr(self, "_gpu_name", None)
+        if cached_gpu is None:
+            self.gpu_status_label.set_text("🔄 Checking for NVIDIA GPU...")
+
+        def probe():
             try:
-                from . import cuda_helper
-            except ImportError:
-                # If cuda_helper doesn't exist, create stub
-                self.gpu_status_label.set_text("GPU detection not available in this build")
-                self.cuda_status_label.set_text("")
-                self.check_gpu_button.set_sensitive(False)
-                self.download_cuda_button.set_sensitive(False)
-                return
-            
-            # Check for NVIDIA GPU
-            has_gpu = cuda_helper.detect_nvidia_gpu()
-            # Use has_talktype_cuda_libraries() for UI display (not system CUDA)
-            has_cuda = cuda_helper.has_talktype_cuda_libraries()
-            
-            if has_gpu:
-                gpu_name = cuda_helper.detect_nvidia_gpu()
+                # Returns the GPU name, or a falsy value
+                gpu_name = cached_gpu if cached_gpu is not None else cuda_helper.detect_nvidia_gpu()
+                # Use has_talktype_cuda_libraries() for UI display (not system CUDA)
+                has_cuda = cuda_helper.has_talktype_cuda_libraries()
+                GLib.idle_add(self._apply_gpu_status, gpu_name, has_cuda, None, on_done)
+            except Exception as e:
+                GLib.idle_add(self._apply_gpu_status, None, False, e, on_done)
+
+        import threading
+        threading.Thread(target=probe, daemon=True).start()
+
+    def _apply_gpu_status(self, gpu_name, has_cuda, error, on_done):
+        """Show the result of a _check_gpu_status() probe (GTK thread)."""
+        try:
+            if error is not None:
+                raise error
+            self._gpu_name = gpu_name
+
+            if gpu_name:
                 if isinstance(gpu_name, str) and len(gpu_name) > 5:
                     self.gpu_status_label.set_markup(f'<span color="#4CAF50">✓ NVIDIA GPU detected: {gpu_name}</span>')
                 else:
@@ -2805,19 +2994,20 @@ Hidden=true
             self.gpu_status_label.set_text(f"Error checking GPU: {e}")
             self.cuda_status_label.set_text("")
             print(f"GPU check error: {e}")
+        if on_done:
+            on_done()
+        return False
 
     def _on_check_gpu_clicked(self, button):
         """Handle Check GPU button click."""
         button.set_label("🔄 Checking...")
         button.set_sensitive(False)
         
-        def check_and_update():
-            self._check_gpu_status()
+        def restore_button():
             button.set_label("🔍 Check for NVIDIA GPU")
             button.set_sensitive(True)
-            return False
         
-        GLib.timeout_add(100, check_and_update)
+        self._check_gpu_status(refresh_gpu=True, on_done=restore_button)
 
     def _on_download_cuda_clicked(self, button):
         """Handle Download CUDA button click."""
@@ -2868,7 +3058,7 @@ Hidden=true
 
             # Update device combo to reflect change and auto-save config
             if hasattr(self, 'device_combo'):
-                self.device_combo.set_active_id("cuda")
+                self._select_device("cuda")
                 # Auto-save to config so tray and service see the change
                 self.config["device"] = "cuda"
                 self.save_config()
@@ -3280,14 +3470,14 @@ Hidden=true
                     pass
 
     def _release_pidfile(self):
-        """Remove the prefs singleton pidfile if it belongs to this process."""
-        try:
-            with open(_PREFS_PIDFILE, "r") as f:
-                cur = int(f.read().strip() or "0")
-            if cur == os.getpid():
-                os.remove(_PREFS_PIDFILE)
-        except Exception:
-            pass
+        """Release the prefs singleton lock so a new window can open right away."""
+        global _prefs_lock_fd
+        if _prefs_lock_fd is not None:
+            try:
+                os.close(_prefs_lock_fd)
+            except OSError:
+                pass
+            _prefs_lock_fd = None
 
     def _show_save_error(self):
         """Error dialog for a failed config save (disk full, permissions…)."""
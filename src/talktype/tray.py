@@ -138,6 +138,10 @@ class DictationTray:
         # Check service status every 1 second and update menu (faster sync in dev mode)
         GLib.timeout_add_seconds(1, self.update_status_and_menu)
 
+        # Build the help dialog in the background so Help opens instantly
+        from .help_dialog import prewarm_help_dialog
+        prewarm_help_dialog()
+
         # Auto-start will be triggered after welcome dialog on first run
         # or immediately if not first run (handled in main())
 
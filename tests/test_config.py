@@ -173,3 +173,55 @@ def test_model_cache_check_fast_unknown_model():
     False for unknown models (used on every Apply/OK click in prefs)."""
     from talktype.model_helper import is_model_cached_fast
     assert is_model_cached_fast("no-such-model") is False
+
+
+def test_repo_manifest_served_from_fresh_cache(tmp_path, monkeypatch):
+    """A recently saved manifest is used without contacting the Hub, and
+    repo docs are filtered out of the download list."""
+    import json
+    from talktype import model_helper
+    monkeypatch.setattr(model_helper, "_MANIFEST_DIR", str(tmp_path))
+    saved = [["model.bin", 100], ["config.json", 2], ["README.md", 5], [".gitattributes", 1]]
+    (tmp_path / "Systran--faster-whisper-tiny.json").write_text(json.dumps(saved))
+
+    manifest = model_helper._get_repo_manifest("Systran/faster-whisper-tiny")
+    assert manifest == [tuple(e) for e in saved]
+    assert model_helper._files_to_download(manifest) == (
+        [("model.bin", 100), ("config.json", 2)], 102)
+
+
+def test_get_cached_models_scans_hub_cache(tmp_path, monkeypatch):
+    """Only models whose snapshot holds every required file count as cached."""
+    from talktype import model_helper
+    monkeypatch.setattr(model_helper, "_hub_cache_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(model_helper, "_cached_models", set())
+    for model, files in (("tiny", model_helper._REQUIRED_MODEL_FILES), ("small", ("config.json",))):
+        snap = tmp_path / f"models--Systran--faster-whisper-{model}" / "snapshots" / "abc"
+        snap.mkdir(parents=True)
+        for name in files:
+            (snap / name).write_text("x")
+    assert model_helper.get_cached_models() == {"tiny"}
+
+
+def test_progress_tqdm_credits_resumed_bytes_once():
+    """huggingface_hub's internal retry opens a second bar at the bytes
+    already on disk; those are not counted twice, and discarding the
+    attempt takes back what both bars counted."""
+    import threading
+    from talktype import model_helper
+    total = [0]
+
+    def add_progress(n, file_info=None):
+        total[0] += n
+
+    bar_cls = model_helper._progress_tqdm_class(add_progress, threading.Event())
+    bar_cls.begin_attempt()
+    first = bar_cls(total=100, desc="model.bin")
+    first.update(40)
+    second = bar_cls(total=100, initial=40, desc="model.bin")
+    assert total[0] == 40
+    second.update(60)
+    assert total[0] == 100
+
+    bar_cls.discard_attempt()
+    assert total[0] == 0
@@ -90,3 +90,12 @@ def test_free_space_bytes(tmp_path):
     # a not-yet-created subdirectory (checks the nearest existing parent).
     assert free_space_bytes(str(tmp_path)) > 0
     assert free_space_bytes(str(tmp_path / "not" / "yet" / "created")) > 0
+
+
+def test_download_file_custom_opener(tmp_path):
+    import urllib.request
+    src, content = _make_source(tmp_path)
+    dest = tmp_path / "dest.bin"
+    opener = urllib.request.build_opener()
+    assert download_file(src.as_uri(), str(dest), opener=opener) is True
+    assert dest.read_bytes() == content
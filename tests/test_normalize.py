@@ -274,3 +274,38 @@ def test_tab_field_separator_still_works():
 def test_line_starting_with_protected_word_is_capitalized():
     """A protected word at line start must still get sentence capitalization."""
     assert normalize_text("return to sender was my favorite song") == "Return to sender was my favorite song."
+
+def test_literal_escapes_multi_word():
+    """'literal'/'the word' escapes keep multi-word commands as plain words."""
+    s = "use the word new line and literal dot dot dot"
+    assert normalize_text(s) == "Use new line and dot dot dot."
+
+def test_soft_line_break_keeps_line_break_priority():
+    """Fused multi-word matching: "line break" still wins over "soft line"."""
+    assert normalize_text("one soft line break two") == "One soft.\u00a7SHIFT_ENTER\u00a7 Two."
+
+def test_plain_text_without_commands_still_tidied():
+    """No spoken commands: the replacement stages are skipped, but spacing,
+    capitalization, auto-period, email and time fixes still apply."""
+    assert normalize_text("hello  world , i think") == "Hello world, I think."
+    assert normalize_text("meet me at 11. 30 p. m.") == "Meet me at 11:30 PM"
+
+def test_repeated_utterance_served_from_cache():
+    normalize_text.cache_clear()
+    first = normalize_text("hello comma world")
+    assert normalize_text("hello comma world") == first
+    assert normalize_text.cache_info().hits == 1
+
+def test_email_and_tld_spacing():
+    assert normalize_text("email john at gmail. com") == "Email john@gmail.com."
+    assert normalize_text("visit example. Org today") == "Visit example.org today."
+    # Words that are not in the TLD list are not glued to the dot
+    assert normalize_text("i went home. It was late") == "I went home. It was late."
+
+def test_lone_command_fast_path_matches_pipeline():
+    from talktype.normalize import _SHORT_COMMANDS, _normalize_pipeline
+    assert normalize_text("Comma") == ""
+    assert normalize_text(" New line ") == "§SHIFT_ENTER§"
+    for phrase, expected in _SHORT_COMMANDS.items():
+        for variant in (phrase, phrase.upper(), phrase.capitalize(), f" {phrase} "):
+            assert _normalize_pipeline(variant) == expected
@@ -56,3 +56,17 @@ def test_coerce_config_types_leaves_correct_types_alone():
     assert out["auto_timeout_minutes"] == 7
     assert out["language"] == "es"
     assert out["custom_key"] == [1]  # unknown keys untouched
+
+
+# --- parsed-TOML cache keyed on the file's mtime and size ---
+
+def test_toml_cache_reparses_only_changed_file(tmp_path):
+    from talktype import prefs
+    path = tmp_path / "config.toml"
+    path.write_text('model = "small"\n')
+    first = prefs._load_toml_cached(str(path))
+    first["model"] = "mutated"  # callers get a copy
+    assert prefs._load_toml_cached(str(path)) == {"model": "small"}
+
+    path.write_text('model = "medium"\nbeeps = false\n')
+    assert prefs._load_toml_cached(str(path)) == {"model": "medium", "beeps": False}